@@ -1,9 +1,172 @@
 # board.py
 import random
-from typing import Tuple, List
+from typing import Tuple, List, Optional
+
+import numpy as np
+
+try:  # optional JIT backend for the enumeration kernel
+    from numba import njit
+except ImportError:
+    njit = None
 
 Rect = Tuple[int, int, int, int]  # (r1,c1,r2,c2) 1-based inclusive
 
+_SUM_CACHE_MAX = 1024  # get_rectangle_sum memo entries kept between moves
+
+_TRI_MASKS = {}  # (H, W) -> bool[r1, r2, c1, c2], True where r1<=r2 and c1<=c2
+
+def _tri_mask(H: int, W: int) -> np.ndarray:
+    m = _TRI_MASKS.get((H, W))
+    if m is None:
+        rows = np.arange(H)[:, None] <= np.arange(H)[None, :]
+        cols = np.arange(W)[:, None] <= np.arange(W)[None, :]
+        m = rows[:, :, None, None] & cols[None, None, :, :]
+        _TRI_MASKS[(H, W)] = m
+    return m
+
+def _enumerate_sum10(grid, H, W):
+    """Loop kernel over the raw uint8 grid: (rects Nx4 0-based r1,c1,r2,c2, apples N).
+    Compiled with numba when available; grows its output instead of
+    materializing every rectangle like the broadcast path does.
+    For each r1 the per-column strip sums are kept running: moving r2 down
+    just adds that one grid row. Values are never negative, so the strip's
+    column prefix P is nondecreasing and for each c1 the matching c2
+    (P[c2+1] == P[c1] + 10) form one contiguous run, found with two
+    forward-only pointers: O(W) per strip instead of O(W^2). An r2 sweep
+    stops once every column of the strip exceeds 10.
+    """
+    cap = 64
+    rects = np.empty((cap, 4), dtype=np.int32)
+    apples = np.empty(cap, dtype=np.int32)
+    n = 0
+    col = np.empty(W, dtype=np.int32)    # sum of column c over rows r1..r2
+    cnt = np.empty(W, dtype=np.int32)    # nonzero cells of column c over rows r1..r2
+    P = np.empty(W + 1, dtype=np.int32)  # prefix of col
+    Q = np.empty(W + 1, dtype=np.int32)  # prefix of cnt
+    for r1 in range(H):
+        col[:] = 0
+        cnt[:] = 0
+        for r2 in range(r1, H):
+            lo = 11
+            P[0] = 0
+            Q[0] = 0
+            for c in range(W):
+                v = grid[r2, c]
+                col[c] += v
+                if v != 0:
+                    cnt[c] += 1
+                P[c+1] = P[c] + col[c]
+                Q[c+1] = Q[c] + cnt[c]
+                if col[c] < lo:
+                    lo = col[c]
+            if lo > 10:
+                break  # every column already exceeds 10 and taller strips only grow
+            a = 0  # first c2 with P[c2+1] >= target
+            b = 0  # first c2 with P[c2+1] >  target
+            for c1 in range(W):
+                target = P[c1] + 10
+                if a < c1:
+                    a = c1
+                while a < W and P[a+1] < target:
+                    a += 1
+                if b < a:
+                    b = a
+                while b < W and P[b+1] == target:
+                    b += 1
+                for c2 in range(a, b):
+                    if n == cap:
+                        cap *= 2
+                        nr = np.empty((cap, 4), dtype=np.int32)
+                        nr[:n] = rects[:n]
+                        rects = nr
+                        na = np.empty(cap, dtype=np.int32)
+                        na[:n] = apples[:n]
+                        apples = na
+                    rects[n, 0] = r1
+                    rects[n, 1] = c1
+                    rects[n, 2] = r2
+                    rects[n, 3] = c2
+                    apples[n] = Q[c2+1] - Q[c1]
+                    n += 1
+    return rects[:n], apples[:n]
+
+def _first_sum10(grid, H, W):
+    """Early-exit variant of _enumerate_sum10: the first (r1, c1, r2, c2) 0-based
+    in the same order, or (-1, -1, -1, -1). Backs has_any_move/first_valid_move
+    when numba is available, so game-over checks stop at the first hit instead
+    of scoring every rectangle.
+    """
+    col = np.empty(W, dtype=np.int32)
+    P = np.empty(W + 1, dtype=np.int32)
+    for r1 in range(H):
+        col[:] = 0
+        for r2 in range(r1, H):
+            lo = 11
+            P[0] = 0
+            for c in range(W):
+                col[c] += grid[r2, c]
+                P[c+1] = P[c] + col[c]
+                if col[c] < lo:
+                    lo = col[c]
+            if lo > 10:
+                break
+            a = 0
+            for c1 in range(W):
+                target = P[c1] + 10
+                if a < c1:
+                    a = c1
+                while a < W and P[a+1] < target:
+                    a += 1
+                if a < W and P[a+1] == target:
+                    return r1, c1, r2, a
+    return -1, -1, -1, -1
+
+if njit is not None:
+    _enumerate_sum10 = njit(cache=True, boundscheck=False)(_enumerate_sum10)
+    _first_sum10 = njit(cache=True, boundscheck=False)(_first_sum10)
+
+class _GridRow(list):
+    """One row of Board.grid. Item writes (`board.grid[r][c] = 0`) go through to
+    grid_np and invalidate the board caches; copies (row[:], list(), copy/deepcopy,
+    pickle) are plain lists.
+    """
+    def __init__(self, board: "Board", r: int, values, rows: "_GridRows"):
+        super().__init__(values)
+        self._board, self._r, self._rows = board, r, rows
+
+    def __setitem__(self, c, v):
+        b = self._board
+        b.grid_np[self._r, c] = v
+        list.__setitem__(self, c, v)
+        b._grid_written(self._rows)
+
+    def __reduce_ex__(self, protocol):
+        return list, (list(self),)
+
+
+class _GridRows(list):
+    """Board.grid itself: `board.grid[r] = row` also writes through."""
+    def __init__(self, board: "Board"):
+        super().__init__()
+        self._board = board
+        self.extend(_GridRow(board, r, vals, self) for r, vals in enumerate(board.grid_np.tolist()))
+
+    def __setitem__(self, r, row):
+        b = self._board
+        if not isinstance(r, int):  # slice: rebuild the whole grid
+            g = [list(x) for x in self]
+            g[r] = row
+            b.grid = g
+            return
+        r = range(b.H)[r]
+        b.grid_np[r] = row
+        list.__setitem__(self, r, _GridRow(b, r, b.grid_np[r].tolist(), self))
+        b._grid_written(self)
+
+    def __reduce_ex__(self, protocol):
+        return list, (list(self),)
+
+
 class Board:
     """Apple board: HxW integers in 1..9.
     A move removes an axis-aligned rectangle iff its sum == 10.
@@ -14,22 +177,129 @@ class Board:
         self.H = H
         self.W = W
         self.rng = random.Random(seed)
-        self.grid = [[self.rng.randint(1, 9) for _ in range(W)] for _ in range(H)]
+        grid = [[self.rng.randint(1, 9) for _ in range(W)] for _ in range(H)]
+        self._set_grid_np(np.array(grid, dtype=np.uint8))
+        self._grid_list: Optional[List[List[int]]] = None
+        # prefix tables (values, nonzero counts), rebuilt lazily when dirty
+        self._ps: Optional[np.ndarray] = None
+        self._ones: Optional[np.ndarray] = None
+        self._dirty = True
+        self._sum_cache = {}  # rect -> sum, valid until the grid changes
+        self._any_move: Optional[bool] = None  # has_any_move() memo, same lifetime
         self.score = 0
         self.total_moves = 0
         self.failed_moves = 0
         self.successful_moves = 0
         self.seed = seed
 
+    # -------- grid --------
+    @property
+    def grid(self) -> List[List[int]]:
+        """List-of-lists view of grid_np for legacy callers (cached until the grid changes).
+        Writing a cell or row through it updates grid_np and the caches.
+        """
+        if self._grid_list is None:
+            self._grid_list = _GridRows(self)
+        return self._grid_list
+
+    @grid.setter
+    def grid(self, rows) -> None:
+        self._set_grid_np(np.array(rows, dtype=np.uint8))
+        self._invalidate()
+
+    def __getstate__(self):
+        # deepcopy/pickle turn the cached grid rows into plain lists bound to nothing;
+        # drop them so the copy rebuilds rows that write through to its own grid_np
+        state = self.__dict__.copy()
+        state["_grid_list"] = None
+        return state
+
+    def _set_grid_np(self, g: np.ndarray) -> None:
+        """Install a C-contiguous uint8 HxW grid."""
+        self.grid_np = np.ascontiguousarray(g, dtype=np.uint8)
+
+    @property
+    def flat(self) -> np.ndarray:
+        """Flat (r*W + c) view of grid_np. Not stored, so deepcopy/pickle keep it a view."""
+        return self.grid_np.reshape(-1)
+
+    def _grid_written(self, rows: "_GridRows") -> None:
+        """After a write through Board.grid: drop caches but keep that list if it is the live one."""
+        live = self._grid_list is rows
+        self._invalidate()
+        if live:
+            self._grid_list = rows
+
+    def _invalidate(self) -> None:
+        """Call after writing to grid_np directly."""
+        self._grid_list = None
+        self._dirty = True
+        self._sum_cache.clear()
+        self._any_move = None
+
+    @classmethod
+    def _from_grid_np(cls, g: np.ndarray, seed: int = 42) -> "Board":
+        """Board around an existing HxW grid, skipping the RNG fill in __init__."""
+        nb = cls.__new__(cls)
+        nb.H, nb.W = g.shape
+        nb.seed = seed
+        nb.rng = random.Random(seed)
+        nb._set_grid_np(g)
+        nb._grid_list = None
+        nb._ps = nb._ones = None
+        nb._dirty = True
+        nb._sum_cache = {}
+        nb._any_move = None
+        nb.score = nb.total_moves = nb.failed_moves = nb.successful_moves = 0
+        return nb
+
+    def copy(self) -> "Board":
+        """Independent snapshot (grid, counters and live prefix tables), no RNG refill."""
+        nb = Board._from_grid_np(self.grid_np.copy(), self.seed)
+        if not self._dirty:
+            nb._ps, nb._ones, nb._dirty = self._ps.copy(), self._ones.copy(), False
+        nb._any_move = self._any_move
+        nb.score = self.score
+        nb.total_moves = self.total_moves
+        nb.failed_moves = self.failed_moves
+        nb.successful_moves = self.successful_moves
+        return nb
+
+    def packed(self) -> bytes:
+        """Grid as 4-bit cells, two per byte (even flat index in the low nibble).
+        (H*W+1)//2 bytes -- 85 for 10x17 -- for cheap snapshots.
+        """
+        f = self.flat
+        if f.size & 1:
+            f = np.concatenate((f, np.zeros(1, dtype=np.uint8)))
+        return (f[0::2] | (f[1::2] << 4)).tobytes()
+
+    @classmethod
+    def from_packed(cls, data: bytes, H: int = 10, W: int = 17, seed: int = 42) -> "Board":
+        """Inverse of packed(); counters start at zero."""
+        b = np.frombuffer(data, dtype=np.uint8)
+        flat = np.empty(b.size * 2, dtype=np.uint8)
+        flat[0::2] = b & 0x0F
+        flat[1::2] = b >> 4
+        return cls._from_grid_np(flat[:H * W].reshape(H, W), seed)
+
     # -------- sums --------
-    def get_rectangle_sum(self, rect: Rect) -> int:
+    def _rect0(self, rect: Rect) -> Tuple[int, int, int, int]:
+        """Validate a 1-based rect and return it 0-based."""
         r1, c1, r2, c2 = (x - 1 for x in rect)
         if not (0 <= r1 <= r2 < self.H and 0 <= c1 <= c2 < self.W):
             raise ValueError("Invalid rectangle coordinates")
-        s = 0
-        for r in range(r1, r2 + 1):
-            for c in range(c1, c2 + 1):
-                s += self.grid[r][c]
+        return r1, c1, r2, c2
+
+    def get_rectangle_sum(self, rect: Rect) -> int:
+        key = tuple(rect)
+        s = self._sum_cache.get(key)
+        if s is None:
+            ps, _ = self._ensure_prefix()
+            s = self._pref_rect(ps, *self._rect0(key))
+            if len(self._sum_cache) >= _SUM_CACHE_MAX:
+                self._sum_cache.clear()
+            self._sum_cache[key] = s
         return s
 
     # alias for old GUI code
@@ -37,42 +307,78 @@ class Board:
         return self.get_rectangle_sum(rect)
 
     def _make_prefix_sum(self):
-        """Create prefix sums for fast enumeration (values + nonzero counts)."""
-        ps = [[0] * (self.W + 1) for _ in range(self.H + 1)]
-        ones = [[0] * (self.W + 1) for _ in range(self.H + 1)]
-        for r in range(1, self.H + 1):
-            for c in range(1, self.W + 1):
-                v = self.grid[r - 1][c - 1]
-                ps[r][c] = v + ps[r - 1][c] + ps[r][c - 1] - ps[r - 1][c - 1]
-                ones[r][c] = (1 if v != 0 else 0) + ones[r - 1][c] + ones[r][c - 1] - ones[r - 1][c - 1]
+        """Create prefix sums for fast enumeration (values + nonzero counts).
+        Both tables are (H+1)x(W+1) with a zero first row/column.
+        """
+        g = self.grid_np
+        ps = np.pad(g.cumsum(0, dtype=np.int32).cumsum(1), ((1, 0), (1, 0)))
+        ones = np.pad((g != 0).cumsum(0, dtype=np.int32).cumsum(1), ((1, 0), (1, 0)))
         return ps, ones
 
+    def _ensure_prefix(self):
+        """Return cached (ps, ones), rebuilding them only after the grid changed."""
+        if self._dirty:
+            self._ps, self._ones = self._make_prefix_sum()
+            self._dirty = False
+        return self._ps, self._ones
+
     def _pref_rect(self, pref, r1, c1, r2, c2):
-        return pref[r2+1][c2+1] - pref[r1][c2+1] - pref[r2+1][c1] + pref[r1][c1]
+        return int(pref[r2+1, c2+1] - pref[r1, c2+1] - pref[r2+1, c1] + pref[r1, c1])
+
+    @staticmethod
+    def _rect_sums(pref) -> np.ndarray:
+        """All rectangle sums at once: out[r1, r2, c1, c2] (0-based, inclusive).
+        Entries with r2 < r1 or c2 < c1 are garbage; mask with _tri_mask.
+        """
+        return (pref[1:, 1:][None, :, None, :] - pref[:-1, 1:][:, None, None, :]
+                - pref[1:, :-1][None, :, :, None] + pref[:-1, :-1][:, None, :, None])
+
+    def _all_rect_sums(self) -> np.ndarray:
+        """Like _rect_sums on the value table, with the garbage entries zeroed."""
+        ps, _ = self._ensure_prefix()
+        return np.where(_tri_mask(self.H, self.W), self._rect_sums(ps), 0)
 
     # -------- move enumeration (ROLLED BACK: 2-tuple) --------
     def find_all_valid_moves(self) -> List[Tuple[Rect, int]]:
         """Return list of (rect, apples_count) with sum==10.
         rect is 1-based inclusive. apples_count = # of nonzero cells in rect.
         """
-        H, W = self.H, self.W
-        ps, ones = self._make_prefix_sum()
-        res: List[Tuple[Rect, int]] = []
-        for r1 in range(H):
-            for r2 in range(r1, H):
-                for c1 in range(W):
-                    for c2 in range(c1, W):
-                        s = self._pref_rect(ps, r1, c1, r2, c2)
-                        if s == 10:
-                            apples = self._pref_rect(ones, r1, c1, r2, c2)
-                            if apples > 0:
-                                res.append(((r1+1, c1+1, r2+1, c2+1), apples))
-        return res
+        if njit is not None:
+            rects, apples = _enumerate_sum10(self.grid_np, self.H, self.W)
+            return [((a+1, b+1, c+1, d+1), n) for (a, b, c, d), n in
+                    zip(rects.tolist(), apples.tolist())]
+        ps, ones = self._ensure_prefix()
+        r1, r2, c1, c2 = np.nonzero(self._all_rect_sums() == 10)  # row-major: same order as the old r1,r2,c1,c2 loops
+        # sum==10 implies at least one nonzero cell, so apples > 0 always holds
+        apples = ones[r2+1, c2+1] - ones[r1, c2+1] - ones[r2+1, c1] + ones[r1, c1]
+        return [((a+1, b+1, c+1, d+1), n) for a, b, c, d, n in
+                zip(r1.tolist(), c1.tolist(), r2.tolist(), c2.tolist(), apples.tolist())]
 
     # legacy name some bots used
     def find_valid_moves(self) -> List[Tuple[Rect, int]]:
         return self.find_all_valid_moves()
 
+    def has_any_move(self) -> bool:
+        """True iff at least one rectangle sums to 10. Memoized until the grid changes,
+        so repeated game-over checks on an unchanged board are free."""
+        if self._any_move is None:
+            if njit is not None:
+                self._any_move = bool(_first_sum10(self.grid_np, self.H, self.W)[0] >= 0)
+            else:
+                self._any_move = bool((self._all_rect_sums() == 10).any())
+        return self._any_move
+
+    def first_valid_move(self) -> Optional[Rect]:
+        """First rect in find_all_valid_moves() order, or None."""
+        if njit is not None:
+            r1, c1, r2, c2 = _first_sum10(self.grid_np, self.H, self.W)
+            return None if r1 < 0 else (int(r1) + 1, int(c1) + 1, int(r2) + 1, int(c2) + 1)
+        idx = np.flatnonzero(self._all_rect_sums() == 10)
+        if idx.size == 0:
+            return None
+        r1, r2, c1, c2 = np.unravel_index(int(idx[0]), (self.H, self.H, self.W, self.W))
+        return (int(r1) + 1, int(c1) + 1, int(r2) + 1, int(c2) + 1)
+
     # -------- rules --------
     def is_valid_matching(self, rect: Rect) -> bool:
         return self.get_rectangle_sum(rect) == 10
@@ -82,15 +388,12 @@ class Board:
         return self.is_valid_matching(rect)
 
     def count_apples_inside_rectangle(self, rect: Rect) -> int:
-        r1, c1, r2, c2 = (x - 1 for x in rect)
-        if not (0 <= r1 <= r2 < self.H and 0 <= c1 <= c2 < self.W):
-            raise ValueError("Invalid rectangle coordinates")
-        cnt = 0
-        for r in range(r1, r2 + 1):
-            for c in range(c1, c2 + 1):
-                if self.grid[r][c] != 0:
-                    cnt += 1
-        return cnt
+        _, ones = self._ensure_prefix()
+        return self._pref_rect(ones, *self._rect0(rect))
+
+    # short name matching rect_sum
+    def rect_nonzero_count(self, rect: Rect) -> int:
+        return self.count_apples_inside_rectangle(rect)
 
     def apply_move(self, rect: Rect) -> None:
         self.total_moves += 1
@@ -100,9 +403,26 @@ class Board:
         self.successful_moves += 1
         self.score += self.count_apples_inside_rectangle(rect)
         r1, c1, r2, c2 = (x - 1 for x in rect)
-        for r in range(r1, r2 + 1):
-            for c in range(c1, c2 + 1):
-                self.grid[r][c] = 0
+        self._clear_rect(r1, c1, r2, c2)
+
+    def _clear_rect(self, r1: int, c1: int, r2: int, c2: int) -> None:
+        """Zero a 0-based inclusive block, patching the prefix tables if they are live."""
+        if not self._dirty:
+            self._apply_delta_to_prefix(r1, c1, r2, c2, self.grid_np[r1:r2 + 1, c1:c2 + 1])
+        self.grid_np[r1:r2 + 1, c1:c2 + 1] = 0
+        self._grid_list = None
+        self._sum_cache.clear()
+        self._any_move = None
+
+    def _apply_delta_to_prefix(self, r1, c1, r2, c2, removed) -> None:
+        """Subtract the block about to be cleared from ps/ones in place.
+        Every ps[i+1][j+1] with i>=r1, j>=c1 loses the removed cells in rows
+        r1..min(i,r2) x cols c1..min(j,c2): the block's own 2-D prefix sum,
+        edge-extended to the bottom/right of the board.
+        """
+        pad = ((0, self.H - 1 - r2), (0, self.W - 1 - c2))
+        self._ps[r1+1:, c1+1:] -= np.pad(removed.cumsum(0, dtype=np.int32).cumsum(1), pad, mode="edge")
+        self._ones[r1+1:, c1+1:] -= np.pad((removed != 0).cumsum(0, dtype=np.int32).cumsum(1), pad, mode="edge")
 
     # -------- debug --------
     def print_board(self) -> None:
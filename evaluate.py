@@ -3,7 +3,7 @@ from __future__ import annotations
 import importlib
 import os
 from dataclasses import dataclass
-from typing import List, Tuple, Any
+from typing import Dict, List, Tuple, Any
 
 from board import Board
 
@@ -13,12 +13,22 @@ Rect = Tuple[int, int, int, int]
 DEFAULT_SEEDS: List[int] = [42, 43, 44, 45, 123, 777, 1001, 2024, 9001, 31415]
 
 # -------- 내부 유틸 --------
+# bot_ref -> 봇 클래스 (프로세스마다 한 번만 import)
+_BOT_CACHE: Dict[str, Any] = {}
+
+def _resolve_bot_cls(bot_ref: str) -> Any:
+    cls = _BOT_CACHE.get(bot_ref)
+    if cls is None:
+        mod_path, cls_name = bot_ref.rsplit(".", 1)
+        mod = importlib.import_module(mod_path)
+        cls = _BOT_CACHE[bot_ref] = getattr(mod, cls_name)
+    return cls
+
 def _resolve_bot(bot_ref: str) -> Any:
-    """'package.module.ClassName' 형태에서 클래스를 찾아 인스턴스화."""
-    mod_path, cls_name = bot_ref.rsplit(".", 1)
-    mod = importlib.import_module(mod_path)
-    cls = getattr(mod, cls_name)
-    return cls()
+    """'package.module.ClassName' 형태에서 클래스를 찾아 인스턴스화.
+    클래스는 캐시하되 인스턴스는 시드마다 새로 만듦(봇 내부 상태가 시드 간에 새지 않도록).
+    """
+    return _resolve_bot_cls(bot_ref)()
 
 def _moves(board: Board):
     """보드가 제공하는 유효수 나열 API (2-튜플: (rect, apples))."""
@@ -29,21 +39,16 @@ def _moves(board: Board):
     return []
 
 def _has_any_move(board: Board) -> bool:
+    if hasattr(board, "has_any_move"):
+        return board.has_any_move()
     return bool(_moves(board))
 
 def _safe_is_valid(board: Board, rect: Rect) -> bool:
     """합==10 이고 직사각형 안에 최소 1칸은 0이 아님(점수 생김)."""
     try:
-        if board.get_rectangle_sum(rect) != 10:
-            return False
+        return board.rect_sum(rect) == 10 and board.rect_nonzero_count(rect) > 0
     except Exception:
         return False
-    r1, c1, r2, c2 = (x-1 for x in rect)
-    for r in range(r1, r2+1):
-        for c in range(c1, c2+1):
-            if board.grid[r][c] != 0:
-                return True
-    return False
 
 # -------- 공개 데이터 구조 --------
 @dataclass
@@ -66,6 +71,8 @@ def run_one_seed(bot_ref: str, seed: int, H: int = 10, W: int = 17, safety: int
     """
     프로세스 풀에서 피클링 가능한 **모듈 탑레벨 함수**.
     - 다른 프로세스에서 import evaluate; evaluate.run_one_seed 로 접근 가능해야 함.
+    - 보드는 자식 프로세스 안에서 만들고 버림: 파이프로 오가는 건 (bot_ref, seed, H, W)와
+      정수 점수뿐이라 공유 메모리로 옮길 데이터가 없음.
     """
     bot = _resolve_bot(bot_ref)
     b = Board(H=H, W=W, seed=seed)
@@ -104,6 +111,8 @@ def evaluate_bot(bot_ref: str, seeds: List[int] = DEFAULT_SEEDS, H: int = 10, W:
             from multiprocessing import get_context
             ctx = get_context("spawn")
             tasks = [(bot_ref, s, H, W) for s in seeds]
+            # initializer로 봇을 미리 import하지 않음: 잘못된 bot_ref면 워커가 초기화 중 죽고
+            # 풀이 계속 재생성해서 멈춤. run_one_seed의 _BOT_CACHE가 프로세스당 한 번만 import
             with ctx.Pool(processes=min(len(seeds), os.cpu_count() or 2)) as pool:
                 # starmap으로 (bot_ref, seed, H, W) 전달
                 scores = pool.starmap(run_one_seed, tasks)  # <-- 탑레벨 함수 참조
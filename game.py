@@ -2,8 +2,9 @@
 # - Game: 게임 상태/진행/봇 상호작용/데이터만 담당 (렌더 X)
 # - 봇 수 선택은 백그라운드 스레드에서 비동기로 계산
 from __future__ import annotations
-import time, random, threading, queue
-from typing import List, Tuple, Optional
+import time, random, threading
+import numpy as np
+from typing import Dict, List, Tuple, Optional
 
 from board import Board
 from bots.greedybot import MyBot as DefaultBot  # 기본 봇은 항상 GreedyBot
@@ -31,53 +32,46 @@ FAIL_APPLY_BACKOFF= 0.2
 
 
 # ---------- 유틸: 보드 스냅샷 ----------
-def _clone_board(b: Board) -> Board:
-    nb = Board(H=b.H, W=b.W, seed=b.seed)
-    nb.grid = [row[:] for row in b.grid]
-    nb.score = b.score
-    nb.total_moves = b.total_moves
-    nb.failed_moves = b.failed_moves
-    nb.successful_moves = b.successful_moves
+# 메인 스레드는 4비트 packed 그리드(bytes) + 스칼라 몇 개만 넘기고, Board 재구성은 워커 스레드에서 함.
+# (seed, score, total_moves, failed_moves, successful_moves) — 봇이 읽을 수 있는 값은 그대로 전달
+Snapshot = Tuple[bytes, int, int, int, int, int]
+
+def _snapshot(b: Board) -> Snapshot:
+    return (b.packed(), b.seed, b.score, b.total_moves, b.failed_moves, b.successful_moves)
+
+def _restore(snap: Snapshot) -> Board:
+    grid_bytes, seed, score, total, failed, ok = snap
+    nb = Board.from_packed(grid_bytes, H, W, seed)
+    nb.score, nb.total_moves, nb.failed_moves, nb.successful_moves = score, total, failed, ok
     return nb
 
 
 # ---------- 유틸: 현재 보드 그리드 기준 직접 계산/적용 ----------
-def _sum_rect_grid(grid: List[List[int]], rect: Rect) -> int:
-    r1, c1, r2, c2 = rect
-    r1 -= 1; c1 -= 1; r2 -= 1; c2 -= 1
-    s = 0
-    for r in range(r1, r2+1):
-        row = grid[r]
-        for c in range(c1, c2+1):
-            s += row[c]
-    return s
-
-def _count_nonzero_rect_grid(grid: List[List[int]], rect: Rect) -> int:
+def _sum_rect_grid(board: Board, rect: Rect) -> int:
+    """직사각형 합. 범위 밖/뒤집힌 rect는 -1 (→ 절대 10이 안 되므로 무효수로 걸러짐)."""
+    # 드래그 중 매 프레임 호출됨 → Board가 수마다 갱신하는 prefix 테이블로 O(1) 조회
+    try:
+        r1, c1, r2, c2 = board._rect0(rect)  # 1<=r1<=r2<=H, 1<=c1<=c2<=W 확인
+    except (TypeError, ValueError):
+        return -1
+    ps, _ = board._ensure_prefix()
+    return board._pref_rect(ps, r1, c1, r2, c2)
+
+def _count_nonzero_rect_grid(board: Board, rect: Rect) -> int:
     r1, c1, r2, c2 = rect
-    r1 -= 1; c1 -= 1; r2 -= 1; c2 -= 1
-    cnt = 0
-    for r in range(r1, r2+1):
-        row = grid[r]
-        for c in range(c1, c2+1):
-            if row[c] != 0:
-                cnt += 1
-    return cnt
+    return int(np.count_nonzero(board.grid_np[r1-1:r2, c1-1:c2]))
 
 def _apply_move_direct(board: Board, rect: Rect) -> bool:
-    """보드 API 캐시/검증에 의존하지 않고 직접 적용. 성공 시 True."""
+    """보드 API(apply_move) 검증에 의존하지 않고 직접 적용. 성공 시 True."""
     board.total_moves += 1
-    if _sum_rect_grid(board.grid, rect) != 10:
+    if _sum_rect_grid(board, rect) != 10:
         board.failed_moves += 1
         return False
-    apples = _count_nonzero_rect_grid(board.grid, rect)
+    apples = _count_nonzero_rect_grid(board, rect)
     board.score += apples
     board.successful_moves += 1
     r1, c1, r2, c2 = rect
-    r1 -= 1; c1 -= 1; r2 -= 1; c2 -= 1
-    for r in range(r1, r2+1):
-        row = board.grid[r]
-        for c in range(c1, c2+1):
-            row[c] = 0
+    board._clear_rect(r1-1, c1-1, r2-1, c2-1)
     return True
 
 
@@ -90,37 +84,44 @@ class _BotWorker(threading.Thread):
     def __init__(self, bot):
         super().__init__(daemon=True)
         self.bot = bot
-        self.jobs: "queue.Queue[Tuple[int, Board]]" = queue.Queue()
-        self.results: "queue.Queue[Tuple[int, Optional[Rect], bool, float]]" = queue.Queue()
+        # 작업/결과는 항상 최대 1개(Game이 _job_inflight로 보장) → 큐 대신 단일 슬롯
+        self._job_slot: Optional[Tuple[int, Snapshot]] = None
+        self._job_evt = threading.Event()
+        self._result_slot: Optional[Tuple[int, Optional[Rect], bool, float]] = None
         self._stop = threading.Event()
 
-    def submit(self, version: int, board_copy: Board):
+    def submit(self, version: int, snap: Snapshot):
         if not self._stop.is_set():
-            self.jobs.put((version, board_copy))
+            self._job_slot = (version, snap)
+            self._job_evt.set()
 
     def poll_result(self) -> Optional[Tuple[int, Optional[Rect], bool, float]]:
-        try:
-            return self.results.get_nowait()
-        except queue.Empty:
-            return None
+        res = self._result_slot
+        if res is not None:
+            self._result_slot = None
+        return res
 
     def stop(self):
         self._stop.set()
 
     def run(self):
         while not self._stop.is_set():
-            try:
-                ver, bcopy = self.jobs.get(timeout=0.1)
-            except queue.Empty:
+            if not self._job_evt.wait(timeout=0.1):
+                continue
+            self._job_evt.clear()
+            job, self._job_slot = self._job_slot, None
+            if job is None:
                 continue
+            ver, snap = job
+            # 봇 전용 사본: 봇이 수읽기로 apply_move 해도 게임 보드에는 영향 없음
+            bcopy = _restore(snap)
             try:
                 # 봇이 gameover를 제공하지 않으면 기본: 가능한 수 없음이면 True
                 if hasattr(self.bot, "gameover"):
                     go = bool(self.bot.gameover(bcopy))
                 else:
                     # 보드 API에 의존 (prefix 캐시가 Board 쪽에서 최신으로 관리된다는 전제)
-                    moves = getattr(bcopy, "find_valid_moves")()
-                    go = (len(moves) == 0)
+                    go = not bcopy.has_any_move()
             except Exception:
                 go = False
 
@@ -130,7 +131,7 @@ class _BotWorker(threading.Thread):
             except Exception:
                 rect = None
 
-            self.results.put((ver, rect, go, time.time()))
+            self._result_slot = (ver, rect, go, time.time())
 
 
 class Game:
@@ -171,10 +172,17 @@ class Game:
 
         rng = random.Random(1)
         self.preview_grid: List[List[int]] = [[rng.randint(1,9) for _ in range(W)] for _ in range(H)]
+        self._preview_np = np.array(self.preview_grid, dtype=np.uint8)
+        self._empty_np = np.zeros((H, W), dtype=np.uint8)
+
+        # 사과가 남은 칸 (r,c) -> 값. 수 적용 때 지운 칸만 빼서 유지 (GUI 전체 그리기용)
+        self._occupied: Dict[Tuple[int, int], int] = {}
+        self._reset_occupied(self.preview_grid)
 
     # ---------- 수명주기 ----------
     def start_new(self):
         self.board = Board(H=H, W=W, seed=self.seed)
+        self._reset_occupied(self.board.grid)
         self.state = "playing"
         self.start_time = time.time()
         self.remain_time = TIME_LIMIT
@@ -197,6 +205,7 @@ class Game:
     def to_start(self):
         self.state = "start"
         self.board = None
+        self._reset_occupied(self.preview_grid)
         self.start_time = None
         self.remain_time = TIME_LIMIT
         self.selecting = False
@@ -210,6 +219,14 @@ class Game:
         self._pending_rect = None
         self._pending_ver = -1
 
+    def _reset_occupied(self, grid: List[List[int]]):
+        self._occupied = {(r, c): v for r, row in enumerate(grid) for c, v in enumerate(row) if v}
+
+    def _drop_occupied(self, cells: List[Cell]):
+        occ = self._occupied
+        for r, c, _ in cells:
+            occ.pop((r, c), None)
+
     def retry(self):
         self.start_new()
 
@@ -247,7 +264,7 @@ class Game:
             self._pending_rect is not None or
             time.time() < self._no_move_backoff_until):
             return
-        self._worker.submit(self._version, _clone_board(self.board))
+        self._worker.submit(self._version, _snapshot(self.board))
         self._job_inflight = True
 
     def _poll_worker(self):
@@ -298,7 +315,7 @@ class Game:
         rect = self._pending_rect
 
         # ---- 현재 보드 그리드로 직접 검증 ----
-        if _sum_rect_grid(self.board.grid, rect) != 10:
+        if _sum_rect_grid(self.board, rect) != 10:
             # 유효하지 않음 → 폐기 & 짧은 백오프
             self._pending_rect = None
             self._no_move_backoff_until = now + FAIL_APPLY_BACKOFF
@@ -321,6 +338,7 @@ class Game:
             return
 
         # 성공: 버전/하이라이트/애니 갱신
+        self._drop_occupied(self.removed_cells)
         self._version += 1
         self.bot_hilite_rect = (r1b, c1b, r2b, c2b)
         self.bot_hilite_t = BORDER_DUR
@@ -357,7 +375,7 @@ class Game:
         c1 = min(self.sel_c1, self.sel_c2); c2 = max(self.sel_c1, self.sel_c2)
         rect = (r1+1, c1+1, r2+1, c2+1)  # 1-based
 
-        if _sum_rect_grid(self.board.grid, rect) != 10:
+        if _sum_rect_grid(self.board, rect) != 10:
             return
 
         # 애니 캡처
@@ -373,6 +391,7 @@ class Game:
             self.bot_hilite_t = 0.0
             return
 
+        self._drop_occupied(self.removed_cells)
         self._version += 1
         self.pop_state = "popping"
         self.pop_t = 0.0
@@ -385,6 +404,16 @@ class Game:
             return self.preview_grid
         return self.board.grid if self.board is not None else [[0]*W for _ in range(H)]
 
+    def current_grid_np(self) -> np.ndarray:
+        """current_grid()의 (H,W) uint8 ndarray 판. 보드 버퍼 그대로이므로 읽기 전용."""
+        if self.state == "start":
+            return self._preview_np
+        return self.board.grid_np if self.board is not None else self._empty_np
+
+    def occupied_cells(self) -> List[Cell]:
+        """사과가 남은 칸 목록 [(r,c,val)] (행 우선 순서, 0 값 칸 제외)."""
+        return [(r, c, v) for (r, c), v in self._occupied.items()]
+
     def score(self) -> int:
         return self.board.score if self.board is not None else 0
 
@@ -394,7 +423,7 @@ class Game:
         r1 = min(self.sel_r1, self.sel_r2); r2 = max(self.sel_r1, self.sel_r2)
         c1 = min(self.sel_c1, self.sel_c2); c2 = max(self.sel_c1, self.sel_c2)
         rect = (r1+1, c1+1, r2+1, c2+1)
-        valid = (_sum_rect_grid(self.board.grid, rect) == 10)
+        valid = (_sum_rect_grid(self.board, rect) == 10)
         return (r1, c1, r2, c2, valid)
 
     def bot_highlight_rect(self) -> Optional[Tuple[int,int,int,int]]:
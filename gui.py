@@ -4,6 +4,7 @@
 
 from __future__ import annotations
 import pygame, pygame.gfxdraw  # type: ignore
+import numpy as np
 from typing import Tuple
 from game import Game, H, W, CELL, GAP, PAD_X, PAD_TOP, TIME_LIMIT
 
@@ -19,8 +20,18 @@ YEL   = (250,222,120)
 RED   = (220, 64, 64)
 GRAY  = (180,180,180)
 
-# HUD / FPS
-FPS = 360
+# 프레임/로직 타이밍
+FPS = 120                 # 렌더 상한 (vsync가 되면 모니터 주사율이 먼저 막음)
+LOGIC_DT = 1.0 / 120      # game.update 고정 스텝
+MAX_LOGIC_STEPS = 8       # 한 프레임에 따라잡을 최대 스텝 (멈춤 후 폭주 방지)
+
+# 선택/봇 테두리 Surface 캐시 상한 (큰 선택은 화면만 한 Surface라 개수 제한)
+BORDER_CACHE_MAX = 32
+# 사과 Surface 캐시 상한 (테마 하나 = 값 9 × 팝 단계들로 ~430장; 테마/폰트가 바뀌면 다시 채움)
+APPLE_CACHE_MAX = 1024
+
+# HUD 시간 바
+BAR_W, BAR_H, BAR_RADIUS = 380, 16, 8
 
 # Modal / UI
 MODAL_W, MODAL_H = 520, 320
@@ -34,28 +45,73 @@ Rect0 = Tuple[int,int,int,int]  # 0-based inclusive
 
 
 # --------- 좌표 변환 & 드로잉 유틸 ---------
+# 셀 좌상단 픽셀 좌표 (상수라 import 시 한 번만 계산)
+X_COORDS = tuple(PAD_X + c * (CELL + GAP) for c in range(W))
+Y_COORDS = tuple(PAD_TOP + r * (CELL + GAP) for r in range(H))
+
 def grid_to_px(r,c):
-    x = PAD_X + c * (CELL + GAP)
-    y = PAD_TOP + r * (CELL + GAP)
-    return x, y
+    return X_COORDS[c], Y_COORDS[r]
+
+def _to_display_format(surf):
+    """화면 모드가 있으면 화면 픽셀 포맷으로 변환 (블릿 때 포맷 변환 제거).
+    캐시에 넣을 때 한 번만 호출할 것 — draw 경로에서 부르면 매번 할당된다."""
+    if pygame.display.get_surface() is None:
+        return surf
+    return surf.convert_alpha()
+
+# (value, scale*32, alpha/16, 사과색, 잎색, font) -> 미리 그린 사과 Surface
+_apple_cache = {}
+
+# (scale, alpha, 사과색, 잎색) -> 숫자 없는 사과 몸통(원+잎). 값 1~9가 같은 몸통을 공유
+_apple_body_cache = {}
+
+def _apple_body(scale, alpha, ac, lc):
+    key = (scale, alpha, ac, lc)
+    body = _apple_body_cache.get(key)
+    if body is None:
+        body = pygame.Surface((CELL, CELL), pygame.SRCALPHA)
+        radius = int((CELL//2 - 3) * scale)
+        pygame.gfxdraw.aacircle(body, CELL//2, CELL//2, radius, (*ac, alpha))
+        pygame.gfxdraw.filled_circle(body, CELL//2, CELL//2, radius, (*ac, alpha))
+        lr = max(4, int(6*scale))
+        pygame.draw.ellipse(body, (*lc, alpha), (CELL//2 + radius//3, CELL//2 - radius - 6, lr*3, lr*2))
+        if len(_apple_body_cache) >= APPLE_CACHE_MAX:
+            _apple_body_cache.clear()
+        _apple_body_cache[key] = body
+    return body
+
+def _render_apple_surface(font, value, scale, alpha, ac, lc):
+    apple_surf = _apple_body(scale, alpha, ac, lc).copy()
+    txt = font.render(str(value), True, WHITE)
+    tr = txt.get_rect(center=(CELL//2, CELL//2))
+    apple_surf.blit(txt, tr)
+    return _to_display_format(apple_surf)
+
+def apple_surface(font, value, scale=1.0, alpha=255, apple_color=None, leaf_color=None):
+    """캐시된 사과 Surface (value != 0)."""
+    ac = apple_color if apple_color is not None else APPLE
+    lc = leaf_color if leaf_color is not None else LEAF
+    # 팝 애니메이션도 캐시에 걸리도록 scale은 1/32, alpha는 16단계로 양자화
+    sq = int(scale * 32)
+    aq = alpha >> 4
+    key = (value, sq, aq, ac, lc, font)
+    img = _apple_cache.get(key)
+    if img is None:
+        if len(_apple_cache) >= APPLE_CACHE_MAX:
+            _apple_cache.clear()
+        img = _apple_cache[key] = _render_apple_surface(font, value, sq / 32, aq * 17, ac, lc)
+    return img
 
 def draw_apple(surf, font, x, y, value, scale=1.0, alpha=255, apple_color=None, leaf_color=None):
     if value == 0:
         return
-    apple_surf = pygame.Surface((CELL, CELL), pygame.SRCALPHA)
-    radius = int((CELL//2 - 3) * scale)
-    ac = apple_color if apple_color is not None else APPLE
-    lc = leaf_color if leaf_color is not None else LEAF
-    pygame.gfxdraw.aacircle(apple_surf, CELL//2, CELL//2, radius, (*ac, alpha))
-    pygame.gfxdraw.filled_circle(apple_surf, CELL//2, CELL//2, radius, (*ac, alpha))
-    lr = max(4, int(6*scale))
-    pygame.draw.ellipse(apple_surf, (*lc, alpha), (CELL//2 + radius//3, CELL//2 - radius - 6, lr*3, lr*2))
-    txt = font.render(str(value), True, WHITE)
-    tr = txt.get_rect(center=(CELL//2, CELL//2))
-    apple_surf.blit(txt, tr)
-    surf.blit(apple_surf, (x, y))
+    surf.blit(apple_surface(font, value, scale, alpha, apple_color, leaf_color), (x, y))
 
-def draw_icon_button(surf, center, radius, bg, icon_text='', icon_font=None, fg=WHITE, outline=None):
+# (radius, bg, icon_text, font, fg, outline) -> 완성된 버튼 Surface
+_button_cache = {}
+_BUTTON_CACHE_MAX = 64
+
+def _render_icon_button(radius, bg, icon_text, icon_font, fg, outline):
     SS = 3
     size_hi = radius * 2 * SS
     hi = pygame.Surface((size_hi, size_hi), pygame.SRCALPHA)
@@ -66,10 +122,26 @@ def draw_icon_button(surf, center, radius, bg, icon_text='', icon_font=None, fg=
     if outline is not None:
         pygame.gfxdraw.aacircle(hi, cx, cy, radius * SS - 2, outline)
     lo = pygame.transform.smoothscale(hi, (radius * 2, radius * 2))
-    surf.blit(lo, (center[0] - radius, center[1] - radius))
-    if icon_text and icon_font:
-        txt = icon_font.render(icon_text, True, fg)
-        surf.blit(txt, (center[0] - txt.get_width()//2, center[1] - txt.get_height()//2))
+    txt = icon_font.render(icon_text, True, fg) if icon_text and icon_font else None
+    # 글자가 원보다 크면 잘리지 않도록 정사각 캔버스를 키움 (중심 유지)
+    half = radius
+    if txt is not None:
+        half = max(half, (txt.get_width() + 1) // 2, (txt.get_height() + 1) // 2)
+    out = pygame.Surface((half * 2, half * 2), pygame.SRCALPHA)
+    out.blit(lo, (half - radius, half - radius))
+    if txt is not None:
+        out.blit(txt, (half - txt.get_width()//2, half - txt.get_height()//2))
+    return _to_display_format(out)
+
+def draw_icon_button(surf, center, radius, bg, icon_text='', icon_font=None, fg=WHITE, outline=None):
+    key = (radius, bg, icon_text, icon_font, fg, outline)
+    img = _button_cache.get(key)
+    if img is None:
+        if len(_button_cache) >= _BUTTON_CACHE_MAX:
+            _button_cache.clear()
+        img = _button_cache[key] = _render_icon_button(radius, bg, icon_text, icon_font, fg, outline)
+    half = img.get_width() // 2
+    surf.blit(img, (center[0] - half, center[1] - half))
 
 
 class GUI:
@@ -80,14 +152,74 @@ class GUI:
         pygame.display.set_caption("Apple Game")
         W_px = PAD_X*2 + W*(CELL+GAP) - GAP
         H_px = PAD_TOP + H*(CELL+GAP) - GAP + 20
-        self.screen = pygame.display.set_mode((W_px, H_px))
+        try:
+            self.screen = pygame.display.set_mode((W_px, H_px), vsync=1)
+        except pygame.error:
+            self.screen = pygame.display.set_mode((W_px, H_px))
         self.clock = pygame.time.Clock()
+        # 화면 일괄 블릿: pygame-ce면 fblits(Rect 목록 안 만듦), 아니면 blits(doreturn=0)
+        if hasattr(self.screen, 'fblits'):
+            self._batch_blit = self.screen.fblits
+        else:
+            screen = self.screen
+            self._batch_blit = lambda seq: screen.blits(seq, doreturn=0)
         self.font = pygame.font.SysFont("arialrounded", 26, bold=True)
         self.hud_font = pygame.font.SysFont("arial", 26, bold=True)
         self.title_font = pygame.font.SysFont('arial', 42, bold=True)
         self.icon_font_small = pygame.font.SysFont('arial', 18, bold=True)
+        self.score_big_font = pygame.font.SysFont('arialrounded', 56, bold=True)
+        self.icon_font_go = pygame.font.SysFont('arial', max(18, BTN_RADIUS), bold=True)
+        # 시작 모달 버튼 폰트: 팝 애니메이션 반지름(0.9R..R)별로 미리 생성
+        self.icon_fonts_start = {
+            r: pygame.font.SysFont('arial', max(20, int(r*0.9)), bold=True)
+            for r in range(int(BTN_RADIUS*0.9), BTN_RADIUS+1)
+        }
         self.game = game
 
+        # 처리하는 이벤트만 큐에 쌓이도록 (키보드/윈도우 잡이벤트 차단)
+        pygame.event.set_blocked(None)
+        pygame.event.set_allowed([pygame.QUIT, pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP,
+                                  pygame.MOUSEMOTION, pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED])
+
+        # 셀 좌표 + 배경 레이어(BG + 모든 패널; 정적이라 한 번만 그림)
+        self._cell_xy = [[(x, y) for x in X_COORDS] for y in Y_COORDS]
+        self._cell_rect_flat = [pygame.Rect(x, y, CELL, CELL) for y in Y_COORDS for x in X_COORDS]
+        tile = pygame.Surface((CELL, CELL), pygame.SRCALPHA)
+        pygame.draw.rect(tile, PANEL, (0, 0, CELL, CELL), border_radius=12)
+        layer = pygame.Surface((W_px, H_px))
+        layer.fill(BG)
+        layer.blits([(tile, xy) for row in self._cell_xy for xy in row], doreturn=0)
+        self._panel_layer = layer.convert()
+
+        # HUD 텍스트 캐시: (값, Surface)
+        self._hud_time_cache = (None, None)
+        self._hud_score_cache = (None, None)
+        # 시간 바: 회색 바탕은 고정, 금색 채움은 채운 폭이 바뀔 때만 다시 그림
+        bar_bg = pygame.Surface((BAR_W, BAR_H), pygame.SRCALPHA)
+        pygame.draw.rect(bar_bg, GRAY, (0, 0, BAR_W, BAR_H), border_radius=BAR_RADIUS)
+        self._bar_bg = bar_bg.convert_alpha()
+        self._hud_bar_cache = (None, None)
+
+        # 부분 다시 그리기(dirty rect) 상태
+        self._hud_rect = pygame.Rect(0, 0, W_px, PAD_TOP - 10)
+        self._prev_grid = None
+        self._overlay_rects = []
+        self._border_cache = {}  # (w, h, color) -> 테두리만 그린 Surface
+        self._last_state = None
+        self._full_redraw = True
+        self._static_key = None    # playing 이외 상태: 마지막으로 내보낸 배경/모달
+        self._static_modal = None
+
+        # 모달 그림자/카드 바탕 (정적) + 합성된 모달 캐시: (키, Surface)
+        shadow = pygame.Surface((MODAL_W+SHADOW_PAD*2, MODAL_H+SHADOW_PAD*2), pygame.SRCALPHA)
+        pygame.draw.rect(shadow, (0,0,0,60), shadow.get_rect(), border_radius=MODAL_RADIUS+2)
+        self._shadow_surf = shadow.convert_alpha()
+        card = pygame.Surface((MODAL_W, MODAL_H), pygame.SRCALPHA)
+        pygame.draw.rect(card, (255,255,255,CARD_ALPHA), card.get_rect(), border_radius=MODAL_RADIUS)
+        self._card_surf = card.convert_alpha()
+        self._start_modal_cache = (None, None)     # 키: 버튼 반지름
+        self._gameover_modal_cache = (None, None)  # 키: 점수
+
         # 시작 모달 팝 애니메이션(렌더 전용)
         self.popup_anim = 0.0
         self.popup_anim_speed = 4.0
@@ -96,28 +228,55 @@ class GUI:
 
     # -------------- 입력 처리 --------------
     def _pos_to_grid(self, mx: int, my: int):
+        """픽셀 -> (r,c). 격자 밖이면 None."""
         c = (mx - PAD_X) // (CELL + GAP)
         r = (my - PAD_TOP) // (CELL + GAP)
-        return int(r), int(c)
+        if 0 <= r < H and 0 <= c < W:
+            return r, c
+        return None
 
-    def _hit_circle(self, mx, my, cx, cy, radius) -> bool:
+    def _pos_to_grid_clamped(self, mx: int, my: int):
+        """픽셀 -> (r,c), 격자 밖은 가장자리 칸으로 (드래그가 밖으로 나가도 끝까지 선택)."""
+        c = (mx - PAD_X) // (CELL + GAP)
+        r = (my - PAD_TOP) // (CELL + GAP)
+        return min(H-1, max(0, r)), min(W-1, max(0, c))
+
+    @staticmethod
+    def _hit_circle(mx, my, cx, cy, radius) -> bool:
+        # 제곱 거리 비교 (sqrt 없음)
         dx = mx - cx; dy = my - cy
         return dx*dx + dy*dy <= radius*radius
 
     # -------------- 메인 루프 --------------
     def run(self):
+        acc = 0.0
+        hit = self._hit_circle
         try:
             while self.running:
-                dt = self.clock.tick(FPS) / 1000.0
-
-                # 업데이트(로직)
-                self.game.update(dt)
-
-                # 입력 이벤트
-                for event in pygame.event.get():
+                acc += self.clock.tick(FPS) / 1000.0
+
+                # 업데이트(로직): 고정 스텝으로 누적 시간만큼 진행
+                steps = 0
+                while acc >= LOGIC_DT and steps < MAX_LOGIC_STEPS:
+                    self.game.update(LOGIC_DT)
+                    acc -= LOGIC_DT
+                    steps += 1
+                if steps == MAX_LOGIC_STEPS:
+                    acc = 0.0
+
+                # 입력 이벤트 (연속된 MOUSEMOTION은 마지막 것만 처리: 선택은 현재 셀만 필요)
+                events = pygame.event.get()
+                n_events = len(events)
+                for i, event in enumerate(events):
+                    if (event.type == pygame.MOUSEMOTION and i + 1 < n_events
+                            and events[i + 1].type == pygame.MOUSEMOTION):
+                        continue
                     if event.type == pygame.QUIT:
                         self.running = False
                         break
+                    if event.type in (pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED):
+                        self._full_redraw = True
+                        continue
 
                     gs = self.game.state
 
@@ -134,10 +293,10 @@ class GUI:
 
                         if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
                             mx, my = event.pos
-                            if self._hit_circle(mx, my, *start_start_center, cur_radius):
+                            if hit(mx, my, *start_start_center, cur_radius):
                                 self.game.start_new()
                                 self.popup_anim = 0.0
-                            elif self._hit_circle(mx, my, *start_quit_center, cur_radius):
+                            elif hit(mx, my, *start_quit_center, cur_radius):
                                 self.running = False
 
                     elif gs == 'playing':
@@ -146,21 +305,23 @@ class GUI:
                             mx, my = event.pos
                             retry_center = (self.screen.get_width() - 120, 40)
                             home_center  = (self.screen.get_width() -  40, 40)
-                            if self._hit_circle(mx, my, *retry_center, IN_ICON_RADIUS):
+                            if hit(mx, my, *retry_center, IN_ICON_RADIUS):
                                 self.game.retry()
                                 continue
-                            if self._hit_circle(mx, my, *home_center, IN_ICON_RADIUS):
+                            if hit(mx, my, *home_center, IN_ICON_RADIUS):
                                 self.game.to_start()
                                 continue
 
                         # 그리드 드래그 선택
                         if self.game.pop_state == "idle":  # 팝 중엔 선택 잠금
                             if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
-                                r, c = self._pos_to_grid(*event.pos)
-                                self.game.begin_selection(r, c)
+                                rc = self._pos_to_grid(*event.pos)
+                                if rc is not None:
+                                    self.game.begin_selection(*rc)
                             elif event.type == pygame.MOUSEMOTION and self.game.selecting:
-                                r, c = self._pos_to_grid(*event.pos)
-                                self.game.update_selection(r, c)
+                                r, c = self._pos_to_grid_clamped(*event.pos)
+                                if r != self.game.sel_r2 or c != self.game.sel_c2:
+                                    self.game.update_selection(r, c)
                             elif event.type == pygame.MOUSEBUTTONUP and event.button == 1 and self.game.selecting:
                                 self.game.end_selection()
 
@@ -176,13 +337,13 @@ class GUI:
                             go_home_center  = (modal_x + (MODAL_W // 2),       modal_y + 210)
                             go_quit_center  = (modal_x + (MODAL_W // 2 + 140), modal_y + 210)
 
-                            if self._hit_circle(mx, my, *go_retry_center, BTN_RADIUS):
+                            if hit(mx, my, *go_retry_center, BTN_RADIUS):
                                 self.game.retry()
                                 continue
-                            if self._hit_circle(mx, my, *go_home_center, BTN_RADIUS):
+                            if hit(mx, my, *go_home_center, BTN_RADIUS):
                                 self.game.to_start()
                                 continue
-                            if self._hit_circle(mx, my, *go_quit_center, BTN_RADIUS):
+                            if hit(mx, my, *go_quit_center, BTN_RADIUS):
                                 self.running = False
                                 continue
 
@@ -194,114 +355,217 @@ class GUI:
             pygame.quit()
 
     # -------------- 렌더 --------------
-    def draw(self):
-        screen = self.screen
-        screen.fill(BG)
-
+    def _draw_hud(self, screen):
         # HUD (항상 보임; playing일 때만 인터랙션)
         score_to_show = self.game.score()
         remain = int(max(0, self.game.remain_time))
-        ttxt = self.hud_font.render(f"Time: {remain}", True, INK)
-        screen.blit(ttxt, (PAD_X, 18))
-        bar_w = 380
-        pygame.draw.rect(screen, GRAY, (PAD_X+120, 26, bar_w, 16), border_radius=8)
+        # 텍스트는 값이 바뀔 때만 다시 렌더
+        if remain != self._hud_time_cache[0]:
+            self._hud_time_cache = (remain, self.hud_font.render(f"Time: {remain}", True, INK).convert_alpha())
+        screen.blit(self._hud_time_cache[1], (PAD_X, 18))
+        bar_w = BAR_W
+        screen.blit(self._bar_bg, (PAD_X+120, 26))
         filled = int(bar_w * (max(0.0, self.game.remain_time) / TIME_LIMIT)) if TIME_LIMIT > 0 else 0
-        pygame.draw.rect(screen, GOLD, (PAD_X+120, 26, filled, 16), border_radius=8)
-        stxt = self.hud_font.render(f"Score: {score_to_show}", True, INK)
-        screen.blit(stxt, (PAD_X + 120 + bar_w + 30, 18))
+        if filled != self._hud_bar_cache[0]:
+            fill = pygame.Surface((max(1, filled), BAR_H), pygame.SRCALPHA)
+            if filled > 0:
+                pygame.draw.rect(fill, GOLD, (0, 0, filled, BAR_H), border_radius=BAR_RADIUS)
+            self._hud_bar_cache = (filled, fill.convert_alpha())
+        screen.blit(self._hud_bar_cache[1], (PAD_X+120, 26))
+        if score_to_show != self._hud_score_cache[0]:
+            self._hud_score_cache = (score_to_show, self.hud_font.render(f"Score: {score_to_show}", True, INK).convert_alpha())
+        screen.blit(self._hud_score_cache[1], (PAD_X + 120 + bar_w + 30, 18))
         draw_icon_button(screen, (screen.get_width() - 120, 40), IN_ICON_RADIUS, GOLD, icon_text='R', icon_font=self.icon_font_small)
         draw_icon_button(screen, (screen.get_width() -  40, 40), IN_ICON_RADIUS, LEAF, icon_text='H', icon_font=self.icon_font_small)
 
-        # Grid
-        grid = self.game.current_grid()
-        for r in range(H):
-            for c in range(W):
-                x,y = grid_to_px(r,c)
-                pygame.draw.rect(screen, PANEL, (x,y,CELL,CELL), border_radius=12)
-                val = grid[r][c]
-                draw_apple(screen, self.font, x, y, val)
+    def _draw_cells(self, screen, grid, r0=0, r1=H-1, c0=0, c1=W-1):
+        # 컴프리헨션 안은 매 칸 실행 → 전역/속성은 지역으로 묶어 둠
+        cell_xy = self._cell_xy
+        surf_of = apple_surface
+        font = self.font
+        cols = range(c0, c1+1)
+        self._batch_blit([(surf_of(font, g_row[c]), xy_row[c])
+                          for g_row, xy_row in zip(grid[r0:r1+1], cell_xy[r0:r1+1])
+                          for c in cols if g_row[c]])
+
+    def _draw_all_cells(self, screen):
+        """전체 격자의 사과: 사과가 남은 칸만 (빈 칸은 순회하지 않음)."""
+        cell_xy = self._cell_xy
+        surf_of = apple_surface
+        font = self.font
+        self._batch_blit([(surf_of(font, v), cell_xy[r][c])
+                          for r, c, v in self.game.occupied_cells()])
+
+    def _repaint_area(self, screen, grid, area):
+        """area 안쪽만 배경 레이어 + 걸치는 셀의 사과를 다시 그림(클립)."""
+        step = CELL + GAP
+        c0 = max(0, (area.left - PAD_X) // step)
+        c1 = min(W-1, (area.right - 1 - PAD_X) // step)
+        r0 = max(0, (area.top - PAD_TOP) // step)
+        r1 = min(H-1, (area.bottom - 1 - PAD_TOP) // step)
+        screen.blit(self._panel_layer, area, area)
+        if r0 <= r1 and c0 <= c1:
+            screen.set_clip(area)
+            self._draw_cells(screen, grid, r0, r1, c0, c1)
+            screen.set_clip(None)
+
+    def _border_surf(self, w, h, color):
+        """둥근 테두리(두께 4)만 그린 투명 Surface. 크기/색별로 캐시."""
+        key = (w, h, color)
+        surf = self._border_cache.get(key)
+        if surf is None:
+            if len(self._border_cache) >= BORDER_CACHE_MAX:
+                self._border_cache.clear()
+            surf = pygame.Surface((w, h), pygame.SRCALPHA)
+            pygame.draw.rect(surf, color, surf.get_rect(), width=4, border_radius=12)
+            surf = self._border_cache[key] = surf.convert_alpha()
+        return surf
+
+    def _draw_overlays(self, screen):
+        """선택/봇 테두리와 팝 애니메이션을 그리고, 그린 영역 목록을 반환."""
+        drawn = []
 
         # Manual selection overlay
         sel = self.game.selection_overlay()
         if sel is not None:
             r1, c1, r2, c2, valid = sel
-            x1,y1 = grid_to_px(r1, c1)
-            x2,y2 = grid_to_px(r2, c2)
+            x1, y1, x2, y2 = X_COORDS[c1], Y_COORDS[r1], X_COORDS[c2], Y_COORDS[r2]
             border = pygame.Rect(x1-3, y1-3, (x2-x1)+CELL+6, (y2-y1)+CELL+6)
-            pygame.draw.rect(screen, (RED if valid else YEL), border, width=4, border_radius=12)
+            screen.blit(self._border_surf(border.w, border.h, RED if valid else YEL), border)
+            drawn.append(border)
 
         # Bot highlight overlay
         bh = self.game.bot_highlight_rect()
         if bh is not None:
             r1, c1, r2, c2 = bh
-            x1,y1 = grid_to_px(r1, c1)
-            x2,y2 = grid_to_px(r2, c2)
+            x1, y1, x2, y2 = X_COORDS[c1], Y_COORDS[r1], X_COORDS[c2], Y_COORDS[r2]
             border = pygame.Rect(x1-3, y1-3, (x2-x1)+CELL+6, (y2-y1)+CELL+6)
-            pygame.draw.rect(screen, RED, border, width=4, border_radius=12)
+            screen.blit(self._border_surf(border.w, border.h, RED), border)
+            drawn.append(border)
 
         # Pop animation layer
         pe = self.game.pop_effect()
         if pe is not None:
             scale, alpha, removed_cells = pe
-            for (r,c,val) in removed_cells:
-                x,y = grid_to_px(r,c)
-                draw_apple(screen, self.font, x, y, val, scale=scale, alpha=alpha)
+            cell_xy = self._cell_xy
+            surf_of = apple_surface
+            font = self.font
+            seq = [(surf_of(font, val, scale, alpha), cell_xy[r][c])
+                   for (r, c, val) in removed_cells if val]
+            self._batch_blit(seq)
+            Rect, size = pygame.Rect, (CELL, CELL)
+            drawn += [Rect(xy, size) for _, xy in seq]
+        return drawn
 
-        # --------- START modal ----------
-        if self.game.state == 'start':
+    def draw(self):
+        state = self.game.state
+        grid = self.game.current_grid()
+        grid_np = self.game.current_grid_np()
+        # playing 중에는 바뀐 곳만 다시 그림. 상태 전환/모달/노출 이벤트 때는 전체.
+        if state == 'playing' and self._last_state == 'playing' and not self._full_redraw:
+            self._draw_partial(grid, grid_np)
+        else:
+            self._draw_full(state)
+        self._last_state = state
+        self._prev_grid = grid_np.copy()  # 보드가 제자리 수정하므로 복사
+
+    def _draw_partial(self, grid, grid_np):
+        screen = self.screen
+        screen.fill(BG, self._hud_rect)
+        self._draw_hud(screen)
+        dirty = [self._hud_rect]
+
+        # 지난 프레임 오버레이 자리 + 값이 바뀐 셀만 복원
+        # 바뀐 칸의 평탄 인덱스 → 미리 만든 셀 Rect 표에서 바로 꺼냄 (좌표 계산 없음)
+        cell_rect = self._cell_rect_flat
+        changed = np.flatnonzero(grid_np != self._prev_grid).tolist()
+        areas = [cell_rect[i] for i in changed]  # 공유 Rect: 읽기 전용
+        areas += self._overlay_rects
+        repaint = self._repaint_area
+        for area in areas:
+            repaint(screen, grid, area)
+        dirty += areas
+
+        self._overlay_rects = self._draw_overlays(screen)
+        dirty += self._overlay_rects
+        pygame.display.update(dirty)
+
+    def _start_modal_surf(self, cur_radius):
+        """시작 모달(카드+제목+버튼)을 버튼 반지름별로 한 번만 합성."""
+        key, modal = self._start_modal_cache
+        if key == cur_radius:
+            return modal
+        modal = self._card_surf.copy()
+        title = self.title_font.render('Apple Game', True, INK)
+        modal.blit(title, (MODAL_W//2 - title.get_width()//2, 56))
+        icon_font = self.icon_fonts_start[cur_radius]
+        draw_icon_button(modal, (MODAL_W//2 - 140, 210), cur_radius, LEAF, icon_text='S', icon_font=icon_font)
+        draw_icon_button(modal, (MODAL_W//2 + 140, 210), cur_radius, INK,  icon_text='Q', icon_font=icon_font)
+        self._start_modal_cache = (cur_radius, modal)
+        return modal
+
+    def _gameover_modal_surf(self, score):
+        """게임오버 모달(카드+제목+점수+버튼)을 점수별로 한 번만 합성."""
+        key, modal = self._gameover_modal_cache
+        if key == score:
+            return modal
+        modal = self._card_surf.copy()
+        title = self.title_font.render('Game Over', True, INK)
+        modal.blit(title, (MODAL_W//2 - title.get_width()//2, 32))
+
+        score_surf = self.score_big_font.render(str(score), True, (0, 0, 0))
+        modal.blit(score_surf, (MODAL_W // 2 - score_surf.get_width() // 2, 110 - score_surf.get_height() // 2))
+
+        icon_font_go = self.icon_font_go
+        draw_icon_button(modal, (MODAL_W // 2 - 140, 210), BTN_RADIUS, GOLD, icon_text='R', icon_font=icon_font_go)
+        draw_icon_button(modal, (MODAL_W // 2,       210), BTN_RADIUS, LEAF, icon_text='H', icon_font=icon_font_go)
+        draw_icon_button(modal, (MODAL_W // 2 + 140, 210), BTN_RADIUS, INK,  icon_text='Q', icon_font=icon_font_go)
+        self._gameover_modal_cache = (score, modal)
+        return modal
+
+    def _draw_full(self, state):
+        """playing 이외 상태/전환 프레임. 화면이 정적이면 건너뛰고, 모달만 바뀌면 모달 영역만 내보냄."""
+        screen = self.screen
+        modal_x = screen.get_width() // 2 - MODAL_W // 2
+        modal_y = screen.get_height() // 2 - MODAL_H // 2
+
+        # 모달 내용 결정 (시작: 팝 반지름, 게임오버: 점수)
+        modal = None
+        if state == 'start':
             # 팝업 애니메이션(렌더 전용)
             if self.popup_anim < 1.0:
                 self.popup_anim = min(1.0, self.popup_anim + (self.popup_anim_speed * self.clock.get_time()/1000.0))
             cur_radius = int(BTN_RADIUS * (0.9 + 0.1 * self.popup_anim))
+            modal = self._start_modal_surf(cur_radius)
+        elif state == 'gameover':
+            modal = self._gameover_modal_surf(self.game.score())
 
-            center_x = screen.get_width() // 2
-            center_y = screen.get_height() // 2
-            start_modal_x = center_x - MODAL_W // 2
-            start_modal_y = center_y - MODAL_H // 2
-
-            # shadow
-            shadow = pygame.Surface((MODAL_W+SHADOW_PAD*2, MODAL_H+SHADOW_PAD*2), pygame.SRCALPHA)
-            pygame.draw.rect(shadow, (0,0,0,60), shadow.get_rect(), border_radius=MODAL_RADIUS+2)
-            screen.blit(shadow, (start_modal_x - SHADOW_PAD, start_modal_y - SHADOW_PAD))
-            # card
-            modal = pygame.Surface((MODAL_W, MODAL_H), pygame.SRCALPHA)
-            pygame.draw.rect(modal, (255,255,255,CARD_ALPHA), modal.get_rect(), border_radius=MODAL_RADIUS)
-            title = self.title_font.render('Apple Game', True, INK)
-            modal.blit(title, (MODAL_W//2 - title.get_width()//2, 56))
-            icon_font = pygame.font.SysFont('arial', max(20, int(cur_radius*0.9)), bold=True)
-            draw_icon_button(modal, (MODAL_W//2 - 140, 210), cur_radius, LEAF, icon_text='S', icon_font=icon_font)
-            draw_icon_button(modal, (MODAL_W//2 + 140, 210), cur_radius, INK,  icon_text='Q', icon_font=icon_font)
-            screen.blit(modal, (start_modal_x, start_modal_y))
-
-        # --------- GAMEOVER modal ----------
-        if self.game.state == 'gameover':
-            center_x = screen.get_width() // 2
-            center_y = screen.get_height() // 2
-            modal_x = center_x - MODAL_W // 2
-            modal_y = center_y - MODAL_H // 2
-
-            shadow = pygame.Surface((MODAL_W+SHADOW_PAD*2, MODAL_H+SHADOW_PAD*2), pygame.SRCALPHA)
-            pygame.draw.rect(shadow, (0,0,0,60), shadow.get_rect(), border_radius=MODAL_RADIUS+2)
-            screen.blit(shadow, (modal_x - SHADOW_PAD, modal_y - SHADOW_PAD))
-
-            modal = pygame.Surface((MODAL_W, MODAL_H), pygame.SRCALPHA)
-            pygame.draw.rect(modal, (255,255,255,CARD_ALPHA), modal.get_rect(), border_radius=MODAL_RADIUS)
-
-            title = self.title_font.render('Game Over', True, INK)
-            modal.blit(title, (MODAL_W//2 - title.get_width()//2, 32))
-
-            score_big = pygame.font.SysFont('arialrounded', 56, bold=True)
-            score_surf = score_big.render(str(self.game.score()), True, (0, 0, 0))
-            modal.blit(score_surf, (MODAL_W // 2 - score_surf.get_width() // 2, 110 - score_surf.get_height() // 2))
-
-            icon_font_go = pygame.font.SysFont('arial', max(18, BTN_RADIUS), bold=True)
-            draw_icon_button(modal, (MODAL_W // 2 - 140, 210), BTN_RADIUS, GOLD, icon_text='R', icon_font=icon_font_go)
-            draw_icon_button(modal, (MODAL_W // 2,       210), BTN_RADIUS, LEAF, icon_text='H', icon_font=icon_font_go)
-            draw_icon_button(modal, (MODAL_W // 2 + 140, 210), BTN_RADIUS, INK,  icon_text='Q', icon_font=icon_font_go)
+        # 모달 밖(HUD/격자/봇 테두리)은 playing 이외 상태에선 변하지 않음
+        bg_key = (state, self.game.bot_highlight_rect())
+        same_bg = state == self._last_state and not self._full_redraw and bg_key == self._static_key
+        if same_bg and modal is self._static_modal:
+            return
 
+        screen.blit(self._panel_layer, (0, 0))
+        self._draw_hud(screen)
+
+        # Grid
+        self._draw_all_cells(screen)
+        self._overlay_rects = self._draw_overlays(screen)
+        self._full_redraw = False
+
+        # --------- START / GAMEOVER modal ----------
+        shadow_rect = None
+        if modal is not None:
+            shadow_rect = screen.blit(self._shadow_surf, (modal_x - SHADOW_PAD, modal_y - SHADOW_PAD))
             screen.blit(modal, (modal_x, modal_y))
 
-        pygame.display.flip()
+        if same_bg and shadow_rect is not None:
+            pygame.display.update(shadow_rect)
+        else:
+            pygame.display.update()
+        self._static_key = bg_key
+        self._static_modal = modal
 
 
 # -------------- entrypoint --------------
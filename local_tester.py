@@ -6,7 +6,7 @@ local_tester.py — Apple Game Local Tester (Mac-friendly)
 - 맥북 대응: 시작 시 데스크톱 크기에 맞춰 '물리 창 크기' 자동 축소 + SCALED|RESIZABLE
 
 요구:
-  pip install pygame
+  pip install pygame numpy
 
 실행 예:
   # 파일 선택 창(Tk)이 떠서 바로 사용
@@ -17,6 +17,7 @@ local_tester.py — Apple Game Local Tester (Mac-friendly)
 
   # 배치 평가(10개 시드)
   python local_tester.py --bot path/to/mybot.py --benchmark
+  python local_tester.py --bot path/to/mybot.py --benchmark --parallel   # 시드별 프로세스 병렬
 
 관찰 모드 조작키:
   ESC: 종료
@@ -35,12 +36,13 @@ from __future__ import annotations
 import os
 import sys
 import time
-import queue
 import threading
 import argparse
 import importlib.util
 from dataclasses import dataclass
-from typing import Optional, Tuple, List
+from typing import Dict, Optional, Tuple, List
+
+import numpy as np
 
 # --- Third party ---
 try:
@@ -88,20 +90,35 @@ GRAY  = (180,180,180)
 
 # Animation
 POP_DUR = 0.15
+POP_BUCKETS = 8  # 팝 애니메이션 진행도(t) 양자화 단계 → 값별 스프라이트 8장만 생성
 BOT_MIN_INTERVAL = 0.5  # 최소 간격(초). 봇이 오래 걸리면 이보다 길어질 수 있음.
+IDLE_FPS = 10  # 애니메이션이 없을 때의 루프 주기 (화면은 다시 그리지 않음)
 
 Rect = Tuple[int,int,int,int]  # (r1,c1,r2,c2) 1-based inclusive
 
+# 1이면 봇 수를 적용 전에 safe_is_valid로 한 번 더 확인하고 무효수를 출력 (디버그용)
+DEBUG_VALIDATE = os.environ.get("APPLE_DEBUG_VALIDATE") == "1"
+
+# 셀 좌상단 픽셀 좌표 (상수라 import 시 한 번만 계산)
+X_COORDS = tuple(PAD_X + c * (CELL + GAP) for c in range(W))
+Y_COORDS = tuple(PAD_TOP + r * (CELL + GAP) for r in range(H))
+
 # --------- Utility ---------
 def grid_to_px(r:int, c:int) -> Tuple[int,int]:
-    x = PAD_X + c * (CELL + GAP)
-    y = PAD_TOP + r * (CELL + GAP)
-    return x, y
+    return X_COORDS[c], Y_COORDS[r]
 
-def import_bot_from_file(py_path: str, class_name: str = "MyBot"):
-    """동적으로 .py 파일에서 MyBot 클래스를 import."""
+# (절대경로, 클래스명) -> (mtime, 봇 클래스): 파일이 바뀌었을 때만 다시 exec
+_BOT_CLASS_CACHE: Dict[Tuple[str, str], Tuple[float, type]] = {}
+
+def load_bot_class(py_path: str, class_name: str = "MyBot"):
+    """동적으로 .py 파일에서 MyBot 클래스를 import. 파일 mtime이 그대로면 캐시된 클래스 반환."""
     if not os.path.exists(py_path):
         raise FileNotFoundError(py_path)
+    key = (os.path.abspath(py_path), class_name)
+    mtime = os.path.getmtime(py_path)
+    cached = _BOT_CLASS_CACHE.get(key)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
     spec = importlib.util.spec_from_file_location("student_bot_module", py_path)
     if spec is None or spec.loader is None:
         raise ImportError(f"spec 로딩 실패: {py_path}")
@@ -111,74 +128,169 @@ def import_bot_from_file(py_path: str, class_name: str = "MyBot"):
     if not hasattr(module, class_name):
         raise AttributeError(f"파일 내에 class {class_name} 이(가) 없습니다.")
     bot_cls = getattr(module, class_name)
-    return bot_cls()
+    _BOT_CLASS_CACHE[key] = (mtime, bot_cls)
+    return bot_cls
+
+def import_bot_from_file(py_path: str, class_name: str = "MyBot"):
+    """봇 인스턴스 생성 (클래스는 load_bot_class 캐시 사용)."""
+    return load_bot_class(py_path, class_name)()
+
+# 시드 -> 처음 상태 Board: 같은 시드의 판은 항상 같으므로 RNG 채우기는 한 번만
+_BOARD_CACHE: Dict[int, Board] = {}
+
+def make_board(seed: int) -> Board:
+    """시드의 시작 보드를 새로 만들어 반환 (캐시된 원본의 copy라 서로 독립)."""
+    tpl = _BOARD_CACHE.get(seed)
+    if tpl is None:
+        tpl = _BOARD_CACHE[seed] = Board(H=H, W=W, seed=seed)
+    return tpl.copy()
 
 def has_any_move(board: Board) -> bool:
     """Board 내부 데이터로 판단: 합==10 직사각형이 하나라도 있으면 True."""
-    return bool(board.find_valid_moves())
+    return board.has_any_move()
 
 def safe_is_valid(board: Board, rect: Rect) -> bool:
     """
     합==10 이고, 최소 한 칸은 0이 아닌지(=실제 제거 점수 > 0)까지 확인.
+    칸 값은 0 이상이라 합==10이면 0 아닌 칸이 반드시 있음 → Board의 누적합 표(SAT)
+    조회 한 번(O(1))으로 충분하고 칸 스캔은 필요 없음.
     """
     try:
-        s = board.rect_sum(rect)
+        return board.rect_sum(rect) == 10
     except Exception:
         return False
-    if s != 10:
-        return False
-    r1,c1,r2,c2 = (x-1 for x in rect)
-    for r in range(r1, r2+1):
-        for c in range(c1, c2+1):
-            if board.grid[r][c] != 0:
-                return True
-    return False
 
 # --------- Headless benchmark (no GUI) ---------
 DEFAULT_SEEDS = [42, 43, 44, 45, 123, 777, 1001, 2024, 9001, 31415]
 
 def run_single_seed(bot, seed: int) -> int:
-    b = Board(H=H, W=W, seed=seed)
+    b = make_board(seed)
     safety = 20000
+    # 게임오버 판정 함수는 루프 밖에서 한 번만 조회 (없으면 보드 스캔)
+    gameover_fn = getattr(bot, "gameover", None)
     while safety > 0:
         safety -= 1
-        # 게임오버 판정
-        if hasattr(bot, "gameover"):
-            if bot.gameover(b):
-                break
-        else:
-            if not has_any_move(b):
+        if gameover_fn is not None:
+            if gameover_fn(b):
                 break
-        # 다음 수
+        elif not has_any_move(b):
+            break
+        # 다음 수 — 유효성은 apply_move가 직접 판정 (무효수면 successful_moves가 안 늘어남)
         mv = bot.nextmove(b)
-        if not mv or not safe_is_valid(b, mv):
-            if not has_any_move(b):
-                break
-            break  # 봇 에러/무효수 보호 종료
-        b.apply_move(mv)
+        if not mv:
+            break  # 수 없음 → 종료 (재스캔 불필요)
+        done = b.successful_moves
+        try:
+            b.apply_move(mv)
+        except Exception:
+            break  # 좌표 범위 밖 등 봇 에러 → 보호 종료
+        if b.successful_moves == done:
+            break  # 무효수 → 보호 종료
     return b.score
 
-def run_benchmark(bot, seeds: List[int] = DEFAULT_SEEDS) -> Tuple[float, List[int]]:
-    scores = [run_single_seed(bot, s) for s in seeds]
-    avg = sum(scores)/len(scores) if scores else 0.0
-    return avg, scores
+def _run_seed_from_file(bot_file: str, seed: int) -> int:
+    """시드 하나 채점. 봇 객체는 피클이 안 될 수 있어서 (자식 프로세스 안에서) 파일로부터 새로 만듦."""
+    return run_single_seed(import_bot_from_file(bot_file, "MyBot"), seed)
 
-# --------- GUI (pygame) with async bot thread ---------
+def run_benchmark(bot, seeds: List[int] = DEFAULT_SEEDS,
+                  parallel: bool = False) -> Tuple[float, List[int]]:
+    """
+    bot: 봇 인스턴스(예전 방식) 또는 봇 파일 경로(.py, 시드마다 새 인스턴스).
+    parallel=True이고 파일 경로면 시드별로 프로세스 풀에서 채점. spawn이라 자식마다
+    pygame/봇 모듈을 다시 import하므로 봇이 느릴 때만 이득 → 기본은 직렬.
+    풀을 못 만들 때만 직렬로 폴백하고, 봇이 던진 예외는 그대로 올라감.
+    """
+    if not isinstance(bot, str):
+        scores = np.fromiter((run_single_seed(bot, s) for s in seeds),
+                             dtype=np.int32, count=len(seeds))
+        avg = float(scores.mean()) if scores.size else 0.0
+        return avg, scores.tolist()
+
+    pool = None
+    procs = min(len(seeds), os.cpu_count() or 1)
+    if parallel and procs > 1:
+        try:
+            # macOS 안전성을 위해 spawn 컨텍스트 사용
+            from multiprocessing import get_context
+            pool = get_context("spawn").Pool(processes=procs)
+        except (OSError, ImportError):
+            pool = None
+    if pool is not None:
+        with pool:
+            scores = np.array(pool.starmap(_run_seed_from_file, [(bot, s) for s in seeds]),
+                              dtype=np.int32)
+    else:
+        scores = np.fromiter((_run_seed_from_file(bot, s) for s in seeds),
+                             dtype=np.int32, count=len(seeds))
+    avg = float(scores.mean()) if scores.size else 0.0
+    return avg, scores.tolist()
+
+def print_benchmark(avg: float, scores: List[int], seeds: List[int] = DEFAULT_SEEDS) -> None:
+    """벤치마크 결과 출력 (평균 ± 표준편차)."""
+    std = float(np.std(scores)) if scores else 0.0
+    print(f"[Benchmark] seeds={seeds}")
+    print("Scores :", scores)
+    print("Average:", f"{avg:.2f} ±{std:.2f}")
+
+# --------- GUI (pygame): 봇 계산은 워커 스레드, 보드 적용은 렌더 루프 ---------
 @dataclass
 class MoveEvent:
     rect0b: Tuple[int,int,int,int]              # 0-based
     removed_cells: List[Tuple[int,int,int]]     # (r,c,val) before removal
 
+class _BotWorker(threading.Thread):
+    """
+    봇의 gameover + nextmove를 렌더 루프 밖에서 계산 (오래 걸리거나 멈춘 봇에도 창은 응답).
+    작업/결과는 항상 최대 1개(WatchSession이 _job_inflight로 보장) → 단일 슬롯.
+    결과: (version, gameover_flag, rect|None, error|None)
+    """
+    def __init__(self):
+        super().__init__(daemon=True)
+        self._job_slot = None
+        self._job_evt = threading.Event()
+        self._result_slot: Optional[Tuple[int, bool, Optional[Rect], Optional[str]]] = None
+        self._stop_evt = threading.Event()  # Thread._stop 메서드와 겹치지 않는 이름
+
+    def submit(self, version: int, bot, gameover_fn, board: Board):
+        self._job_slot = (version, bot, gameover_fn, board)
+        self._job_evt.set()
+
+    def poll_result(self) -> Optional[Tuple[int, bool, Optional[Rect], Optional[str]]]:
+        res = self._result_slot
+        if res is not None:
+            self._result_slot = None
+        return res
+
+    def stop(self):
+        self._stop_evt.set()
+        self._job_evt.set()
+
+    def run(self):
+        while not self._stop_evt.is_set():
+            self._job_evt.wait()
+            self._job_evt.clear()
+            job, self._job_slot = self._job_slot, None
+            if job is None:
+                continue
+            ver, bot, gameover_fn, board = job
+            try:
+                # 게임 끝? (봇 자체 판정 → 빠른 스캔)
+                go = (gameover_fn is not None and bool(gameover_fn(board))) or not has_any_move(board)
+                rect = None if go else bot.nextmove(board)
+            except Exception as e:
+                self._result_slot = (ver, False, None, str(e))
+                continue
+            self._result_slot = (ver, go, rect, None)
+
 class WatchSession:
-    """렌더링은 메인 스레드, 봇은 별도 스레드에서 동작."""
+    """봇은 워커 스레드가 보드 사본으로 계산, 렌더 루프가 step()에서 결과를 받아 적용."""
     def __init__(self, bot_file: str, seed: int = 42):
         self.bot_file = bot_file
         self.seed = seed
         self.bot = import_bot_from_file(bot_file, "MyBot")
+        self._bot_gameover = getattr(self.bot, "gameover", None)
 
-        self.board = Board(H=H, W=W, seed=seed)
-        self.lock = threading.Lock()
-        self.events: "queue.Queue[MoveEvent|str]" = queue.Queue()
+        self.board = make_board(seed)
 
         # UI/anim
         self.state = "idle"  # "idle"|"popping"
@@ -186,111 +298,131 @@ class WatchSession:
         self.removed_cells: List[Tuple[int,int,int]] = []
         self.hilite_rect0b: Optional[Tuple[int,int,int,int]] = None
         self.hilite_t = 0.0
+        self.text_cache: Dict[str, "pygame.Surface"] = {}  # HUD 문자열 -> 렌더된 Surface
 
         self.running = True
         self.paused = False
         self.finished = False
-        self.last_apply_time = 0.0
+        self.last_apply_time = 0.0  # 마지막 적용(또는 무효수/수 없음) 시각 → 다음 요청은 BOT_MIN_INTERVAL 뒤
 
-        # worker thread
-        self.worker = threading.Thread(target=self._bot_worker, daemon=True)
-        self.worker.start()
+        # 봇 워커: 보드 버전이 바뀌면(리셋) 계산 중이던 결과는 버림
+        self._version = 0
+        self._job_inflight = False
+        self._worker = _BotWorker()
+        self._worker.start()
 
     def reset(self, seed: Optional[int] = None):
-        with self.lock:
-            if seed is not None:
-                self.seed = seed
-            self.board = Board(H=H, W=W, seed=self.seed)
-            self.state = "idle"
-            self.anim_t = 0.0
-            self.removed_cells.clear()
-            self.hilite_rect0b = None
-            self.hilite_t = 0.0
-            self.finished = False
-            self.last_apply_time = 0.0
-        # 봇 인스턴스 재생성(내부 상태 유지형 대비)
+        if seed is not None:
+            self.seed = seed
+        self.board = make_board(self.seed)
+        self.state = "idle"
+        self.anim_t = 0.0
+        self.removed_cells.clear()
+        self.hilite_rect0b = None
+        self.hilite_t = 0.0
+        self.finished = False
+        self.last_apply_time = 0.0
+        self.text_cache.clear()
+        # 봇 인스턴스 재생성(내부 상태 유지형 대비). 파일이 안 바뀌었으면 다시 import 하지 않음
         self.bot = import_bot_from_file(self.bot_file, "MyBot")
+        self._bot_gameover = getattr(self.bot, "gameover", None)
+        # 이전 봇이 아직 계산 중(혹은 멈춤)일 수 있으니 워커도 새로 (이전 것은 끝나면 조용히 종료)
+        self._version += 1
+        self._worker.stop()
+        self._worker = _BotWorker()
+        self._worker.start()
+        self._job_inflight = False
 
     def stop(self):
         self.running = False
-
-    def _bot_worker(self):
-        # 렌더링과 독립 실행: 최소 간격만 보장
-        while self.running:
-            if self.paused or self.finished:
-                time.sleep(0.05)
-                continue
-
-            # 최소 간격 보장
-            if (time.time() - self.last_apply_time) < BOT_MIN_INTERVAL:
-                time.sleep(0.01)
-                continue
-
-            # 게임 끝?
-            with self.lock:
-                board_ref = self.board
-                # 미리 빠른 종료 스캔
-                if hasattr(self.bot, "gameover") and self.bot.gameover(board_ref):
-                    self.finished = True
-                    self.events.put("gameover")
-                    continue
-                if not has_any_move(board_ref):
-                    self.finished = True
-                    self.events.put("gameover")
-                    continue
-
-            # 다음 수 계산 (오래 걸려도 렌더링은 계속 됨) — 잠금 없이 호출
-            try:
-                rect = self.bot.nextmove(board_ref)
-            except Exception as e:
-                self.events.put(f"error: {e}")
+        self._worker.stop()
+
+    def step(self) -> "MoveEvent | str | None":
+        """봇 결과가 왔으면 적용, 최소 간격이 지났으면 다음 계산 요청.
+        MoveEvent / "gameover" / "error: ..." / None."""
+        if self.paused or self.finished:
+            return None
+        if self._job_inflight:
+            res = self._worker.poll_result()
+            if res is None:
+                return None  # 아직 계산 중 — 렌더링은 계속
+            self._job_inflight = False
+            ver, go, rect, err = res
+            if ver == self._version:
+                return self._apply_result(go, rect, err)
+            return None
+        if (time.time() - self.last_apply_time) >= BOT_MIN_INTERVAL:
+            # 봇에는 사본을 줌: 수읽기로 apply_move 해도 화면 보드는 그대로
+            self._worker.submit(self._version, self.bot, self._bot_gameover, self.board.copy())
+            self._job_inflight = True
+        return None
+
+    def _apply_result(self, go: bool, rect: Optional[Rect], err: Optional[str]) -> "MoveEvent | str | None":
+        if err is not None:
+            self.finished = True
+            return f"error: {err}"
+        board = self.board
+        if go:
+            self.finished = True
+            return "gameover"
+        # 수 없음/무효수도 적용한 것처럼 간격을 두고 재시도 (같은 무효수를 매 프레임 부르지 않도록)
+        self.last_apply_time = time.time()
+        if not rect:
+            # 수 없음 → 재확인 후 종료
+            if not has_any_move(board):
                 self.finished = True
-                continue
-
-            if not rect:
-                # 수 없음 → 재확인 후 종료/대기
-                with self.lock:
-                    if not has_any_move(self.board):
-                        self.finished = True
-                        self.events.put("gameover")
-                time.sleep(0.05)
-                continue
+                return "gameover"
+            return None
+        if DEBUG_VALIDATE and not safe_is_valid(board, rect):
+            print(f"invalid move: {rect}")
 
-            # 적용 직전 유효성 재확인 & removed_cells 준비 (잠금 하에)
-            with self.lock:
-                if not safe_is_valid(self.board, rect):
-                    # 무효수: 다음 루프
-                    time.sleep(0.02)
-                    continue
-                r1b, c1b, r2b, c2b = rect[0]-1, rect[1]-1, rect[2]-1, rect[3]-1
-                removed = [(r, c, self.board.grid[r][c])
-                           for r in range(r1b, r2b+1)
-                           for c in range(c1b, c2b+1)]
-                # 먼저 이벤트 큐에 알리고
-                self.events.put(MoveEvent((r1b,c1b,r2b,c2b), removed))
-                # 실제 적용
-                self.board.apply_move(rect)
-                self.last_apply_time = time.time()
-
-            time.sleep(0.001)
+        # 제거될 칸 값 스냅샷 후 바로 적용 — 유효성은 apply_move가 판정
+        done = board.successful_moves
+        try:
+            r1b, c1b, r2b, c2b = (x - 1 for x in rect)
+            snap = board.grid_np[r1b:r2b+1, c1b:c2b+1].tolist()
+            board.apply_move(rect)
+        except Exception:
+            return None  # 좌표가 잘못된 수
+        if board.successful_moves == done:
+            return None  # 무효수
+        removed = [(r1b+i, c1b+j, v)
+                   for i, row in enumerate(snap)
+                   for j, v in enumerate(row) if v]
+        self._version += 1
+        return MoveEvent((r1b,c1b,r2b,c2b), removed)
 
 # --- Drawing helpers ---
-def draw_apple(surface, font, x, y, value, scale=1.0, alpha=255):
-    if value == 0:
-        return
-    apple_surf = pygame.Surface((CELL, CELL), pygame.SRCALPHA)
-    radius = int((CELL//2 - 3) * scale)
-    pygame.gfxdraw.aacircle(apple_surf, CELL//2, CELL//2, radius, (*APPLE, alpha))
-    pygame.gfxdraw.filled_circle(apple_surf, CELL//2, CELL//2, radius, (*APPLE, alpha))
-    # leaf
-    lr = max(4, int(6*scale))
-    pygame.draw.ellipse(apple_surf, (*LEAF, alpha),
-                        (CELL//2 + radius//3, CELL//2 - radius - 6, lr*3, lr*2))
+# (scale, alpha) -> 숫자 없는 사과 몸통(원+잎). 값 1~9가 같은 몸통을 공유
+_APPLE_BODY_CACHE: Dict[Tuple[float, int], "pygame.Surface"] = {}
+
+def _apple_body(scale: float, alpha: int) -> "pygame.Surface":
+    body = _APPLE_BODY_CACHE.get((scale, alpha))
+    if body is None:
+        body = pygame.Surface((CELL, CELL), pygame.SRCALPHA)
+        radius = int((CELL//2 - 3) * scale)
+        pygame.gfxdraw.aacircle(body, CELL//2, CELL//2, radius, (*APPLE, alpha))
+        pygame.gfxdraw.filled_circle(body, CELL//2, CELL//2, radius, (*APPLE, alpha))
+        # leaf
+        lr = max(4, int(6*scale))
+        pygame.draw.ellipse(body, (*LEAF, alpha),
+                            (CELL//2 + radius//3, CELL//2 - radius - 6, lr*3, lr*2))
+        _APPLE_BODY_CACHE[(scale, alpha)] = body
+    return body
+
+def render_apple_sprite(font, value, scale=1.0, alpha=255) -> "pygame.Surface":
+    """사과 한 칸(CELL×CELL, SRCALPHA)을 반환. 원+잎은 캐시된 몸통을 복사해 씀."""
+    apple_surf = _apple_body(scale, alpha).copy()
     # number
     txt = font.render(str(value), True, WHITE)
     tr = txt.get_rect(center=(CELL//2, CELL//2))
     apple_surf.blit(txt, tr)
-    surface.blit(apple_surf, (x, y))
+    return apple_surf
+
+def draw_apple(surface, font, x, y, value, scale=1.0, alpha=255):
+    if value == 0:
+        return
+    surface.blit(render_apple_sprite(font, value, scale, alpha), (x, y))
 
 def run_watch(bot_file: str, seed: int = 42):
     pygame.init()
@@ -324,14 +456,48 @@ def run_watch(bot_file: str, seed: int = 42):
     font = pygame.font.SysFont("arialrounded", 26, bold=True)
     hud_font = pygame.font.SysFont("arial", 24, bold=True)
 
+    # 정적 배경: BG + 패널 170개를 한 장에 미리 그려 둠 (둥근 패널 하나를 템플릿으로 찍기)
+    panel_tpl = pygame.Surface((CELL, CELL), pygame.SRCALPHA)
+    pygame.draw.rect(panel_tpl, PANEL, (0,0,CELL,CELL), border_radius=12)
+    grid_bg = pygame.Surface((W_px, H_px))
+    grid_bg.fill(BG)
+    grid_bg.blits([(panel_tpl, (x, y)) for y in Y_COORDS for x in X_COORDS], doreturn=0)
+    grid_bg = grid_bg.convert()
+    # 하단 도움말: 마지막 줄 사과 위에 겹쳐 그려지므로 배경에 굽지 않고 렌더만 미리
+    help1 = "ESC:Quit  F:Fullscreen  SPACE/P:Pause  R:Reset(seed)  N:New Seed"
+    help_txt = pygame.font.SysFont("arial", 18).render(help1, True, INK).convert_alpha()
+
+    # 사과 스프라이트: 값(1~9)별 한 번만 그림. 팝 애니메이션은 (값, 진행도 단계)별 캐시
+    apple_sprites = [None] + [render_apple_sprite(font, v).convert_alpha() for v in range(1, 10)]
+    pop_sprites = {}
+    # pygame-ce면 fblits, 아니면 blits(doreturn=0)
+    if hasattr(screen, "fblits"):
+        blit_batch = screen.fblits
+    else:
+        blit_batch = lambda seq: screen.blits(seq, doreturn=0)
+
     sess = WatchSession(bot_file, seed)
 
+    def hud_text(text: str) -> "pygame.Surface":
+        # 값이 안 바뀌면 font.render 없이 재사용 (리셋 때 캐시 비움)
+        surf = sess.text_cache.get(text)
+        if surf is None:
+            surf = sess.text_cache[text] = hud_font.render(text, True, INK).convert_alpha()
+        return surf
+
+    # 부분 갱신용: HUD 줄 영역, 직전 프레임의 하이라이트 테두리 영역
+    hud_rect = pygame.Rect(0, 0, W_px, 18 + hud_font.get_linesize())
+    prev_border: Optional[pygame.Rect] = None
+    full_update = True  # 첫 프레임·입력(리셋/전체화면/리사이즈 등) 후에는 전체 flip
+
     running = True
+    busy = True  # 직전 프레임에 애니메이션 진행 중이었나 → 이번 tick 주기 결정
     while running and sess.running:
-        dt = clock.tick(FPS) / 1000.0
+        dt = clock.tick(FPS if busy else IDLE_FPS) / 1000.0
 
         # 이벤트 처리
-        for event in pygame.event.get():
+        events = pygame.event.get()
+        for event in events:
             if event.type == pygame.QUIT:
                 running = False
                 sess.stop()
@@ -352,24 +518,20 @@ def run_watch(bot_file: str, seed: int = 42):
                     except Exception:
                         pass
 
-        # 봇 이벤트 폴링 (non-blocking)
-        try:
-            while True:
-                ev = sess.events.get_nowait()
-                if isinstance(ev, str):
-                    if ev.startswith("error:"):
-                        print(ev)
-                        sess.finished = True
-                    elif ev == "gameover":
-                        sess.finished = True
-                elif isinstance(ev, MoveEvent):
-                    sess.hilite_rect0b = ev.rect0b
-                    sess.hilite_t = 0.25
-                    sess.removed_cells = ev.removed_cells
-                    sess.state = "popping"
-                    sess.anim_t = 0.0
-        except queue.Empty:
-            pass
+        # 봇 한 수 진행 (큐 없이 결과를 바로 반영)
+        ev = sess.step()
+        if isinstance(ev, MoveEvent):
+            sess.hilite_rect0b = ev.rect0b
+            sess.hilite_t = 0.25
+            sess.removed_cells = ev.removed_cells
+            sess.state = "popping"
+            sess.anim_t = 0.0
+        elif ev is not None and ev.startswith("error:"):
+            print(ev)
+
+        # 입력·새 수·애니메이션(끝나는 프레임 포함)이 없으면 이전 화면 그대로 둠
+        redraw = busy or bool(events) or ev is not None
+        full_update = full_update or bool(events)
 
         # 팝 애니메이션
         if sess.state == "popping":
@@ -384,48 +546,65 @@ def run_watch(bot_file: str, seed: int = 42):
             if sess.hilite_t == 0.0:
                 sess.hilite_rect0b = None
 
+        busy = sess.state == "popping" or sess.hilite_t > 0.0
+        if not redraw:
+            continue
+
         # ------- DRAW -------
-        screen.fill(BG)
+        screen.blit(grid_bg, (0, 0))
 
         # HUD
-        stxt = hud_font.render(f"Score: {sess.board.score}", True, INK)
-        letxt = hud_font.render(f"Seed: {sess.seed}", True, INK)
-        statxt = hud_font.render(f"{'PAUSED' if sess.paused else ('FINISHED' if sess.finished else 'RUNNING')}", True, INK)
+        stxt = hud_text(f"Score: {sess.board.score}")
+        letxt = hud_text(f"Seed: {sess.seed}")
+        statxt = hud_text('PAUSED' if sess.paused else ('FINISHED' if sess.finished else 'RUNNING'))
         screen.blit(stxt, (PAD_X, 18))
         screen.blit(letxt, (PAD_X + 180, 18))
         screen.blit(statxt, (PAD_X + 340, 18))
 
         # Grid + apples
-        with sess.lock:
-            for r in range(H):
-                for c in range(W):
-                    x,y = grid_to_px(r,c)
-                    pygame.draw.rect(screen, PANEL, (x,y,CELL,CELL), border_radius=12)
-                    draw_apple(screen, font, x, y, sess.board.grid[r][c])
-
-        # Bot highlight rectangle
+        blit_batch([(apple_sprites[v], (X_COORDS[c], y))
+                    for y, row in zip(Y_COORDS, sess.board.grid) for c, v in enumerate(row) if v])
+
+        # Bot highlight rectangle (사라진 칸·팝 애니메이션도 전부 이 테두리 안)
+        border = None
         if sess.hilite_rect0b is not None:
             r1, c1, r2, c2 = sess.hilite_rect0b
-            x1,y1 = grid_to_px(r1,c1)
-            x2,y2 = grid_to_px(r2,c2)
+            x1, y1, x2, y2 = X_COORDS[c1], Y_COORDS[r1], X_COORDS[c2], Y_COORDS[r2]
             border = pygame.Rect(x1-3, y1-3, (x2-x1)+CELL+6, (y2-y1)+CELL+6)
             pygame.draw.rect(screen, RED, border, width=4, border_radius=12)
 
         # Pop animation shrinking over removed cells
         if sess.state == "popping":
             t = min(1.0, sess.anim_t/POP_DUR)
-            scale = 1.0 - t*t
-            alpha = int(255*(1.0 - t))
+            step = min(POP_BUCKETS - 1, int(t * POP_BUCKETS))
+            seq = []
             for (r,c,val) in sess.removed_cells:
-                x,y = grid_to_px(r,c)
-                draw_apple(screen, font, x, y, val, scale=scale, alpha=alpha)
+                if val == 0:
+                    continue
+                spr = pop_sprites.get((val, step))
+                if spr is None:
+                    tq = step / POP_BUCKETS
+                    spr = render_apple_sprite(font, val, scale=1.0 - tq*tq,
+                                              alpha=int(255*(1.0 - tq))).convert_alpha()
+                    pop_sprites[(val, step)] = spr
+                seq.append((spr, (X_COORDS[c], Y_COORDS[r])))
+            blit_batch(seq)
 
         # Footer help
-        help1 = "ESC:Quit  F:Fullscreen  SPACE/P:Pause  R:Reset(seed)  N:New Seed"
-        htxt = pygame.font.SysFont("arial", 18).render(help1, True, INK)
-        screen.blit(htxt, (PAD_X, H_px-26))
-
-        pygame.display.flip()
+        screen.blit(help_txt, (PAD_X, H_px-26))
+
+        # 바뀐 곳은 HUD + 이번/직전 테두리 영역뿐 → 작으면 그 부분만 올림
+        dirty = [hud_rect]
+        if border is not None:
+            dirty.append(border)
+        if prev_border is not None and prev_border != border:
+            dirty.append(prev_border)
+        prev_border = border
+        if full_update or sum(r.w * r.h for r in dirty) * 2 > W_px * H_px:
+            pygame.display.flip()
+            full_update = False
+        else:
+            pygame.display.update(dirty)
 
     pygame.quit()
 
@@ -491,11 +670,8 @@ def ask_user_inputs_with_tk():
         if mode_var.get() == "watch":
             run_watch(path, seed=s)
         else:
-            bot = import_bot_from_file(path, "MyBot")
-            avg, scores = run_benchmark(bot, DEFAULT_SEEDS)
-            print(f"[Benchmark] seeds={DEFAULT_SEEDS}")
-            print("Scores :", scores)
-            print("Average:", f"{avg:.2f}")
+            avg, scores = run_benchmark(path, DEFAULT_SEEDS)
+            print_benchmark(avg, scores)
 
     tk.Button(frm, text="실행", command=run_now).grid(row=3, column=2, sticky="e", pady=(16,0))
 
@@ -530,6 +706,7 @@ def main():
     ap.add_argument("--seed", type=int, default=42, help="초기 시드 (기본: 42)")
     ap.add_argument("--watch", action="store_true", help="Pygame GUI로 관찰 모드 실행")
     ap.add_argument("--benchmark", action="store_true", help="표준 10개 시드로 빠른 평가 실행")
+    ap.add_argument("--parallel", action="store_true", help="벤치마크를 시드별 프로세스로 병렬 실행 (느린 봇용)")
     args = ap.parse_args()
 
     # 인자 없으면 GUI 런처
@@ -542,11 +719,8 @@ def main():
         sys.exit(1)
 
     if args.benchmark:
-        bot = import_bot_from_file(args.bot, "MyBot")
-        avg, scores = run_benchmark(bot, DEFAULT_SEEDS)
-        print(f"[Benchmark] seeds={DEFAULT_SEEDS}")
-        print("Scores :", scores)
-        print("Average:", f"{avg:.2f}")
+        avg, scores = run_benchmark(args.bot, DEFAULT_SEEDS, parallel=args.parallel)
+        print_benchmark(avg, scores)
         return
 
     # watch (GUI)
@@ -0,0 +1,70 @@
+# 학생 봇이 수읽기용으로 보드를 deepcopy/pickle 해도 동작하는지 확인
+#   python -m unittest discover -s tests
+import copy
+import os
+import pickle
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from board import Board
+
+
+class BoardCopyTest(unittest.TestCase):
+    def setUp(self):
+        self.board = Board(seed=3)
+        self.board.has_any_move()  # 캐시/prefix 테이블이 살아 있는 상태에서 복사
+        self.move = self.board.find_all_valid_moves()[0][0]
+
+    def test_deepcopy_is_independent(self):
+        b = self.board
+        before = b.packed()
+        c = copy.deepcopy(b)
+        c.apply_move(self.move)
+        self.assertEqual(c.successful_moves, 1)
+        self.assertNotEqual(c.packed(), before)  # flat이 사본의 grid_np를 따라감
+        self.assertEqual(b.packed(), before)
+        self.assertEqual(b.score, 0)
+
+    def test_pickle_roundtrip(self):
+        b = self.board
+        p = pickle.loads(pickle.dumps(b))
+        self.assertEqual(p.packed(), b.packed())
+        self.assertEqual(p.has_any_move(), b.has_any_move())
+
+
+class GridWriteThroughTest(unittest.TestCase):
+    def test_cell_writes_update_the_board(self):
+        b = Board(seed=3)
+        b.has_any_move()  # 캐시가 살아 있는 상태에서 수정
+        b.grid[0][0] = 0
+        self.assertEqual(int(b.grid_np[0, 0]), 0)
+        self.assertEqual(b.grid[0][0], 0)
+        self.assertEqual(b.rect_sum((1, 1, 1, 1)), 0)
+        b.grid[1] = [1] * b.W
+        self.assertEqual(b.grid_np[1].tolist(), [1] * b.W)
+
+    def test_lookahead_on_deepcopy(self):
+        # 예전 봇 방식: 사본의 grid를 고쳐서 수읽기 → 원본은 그대로
+        b = Board(seed=3)
+        moves = b.find_all_valid_moves()
+        c = copy.deepcopy(b)
+        (r1, c1, r2, c2), _ = moves[0]
+        for r in range(r1 - 1, r2):
+            for col in range(c1 - 1, c2):
+                c.grid[r][col] = 0
+        self.assertNotIn(moves[0][0], [m for m, _ in c.find_all_valid_moves()])
+        self.assertEqual(len(b.find_all_valid_moves()), len(moves))
+
+    def test_copies_are_detached(self):
+        b = Board(seed=3)
+        g = [row[:] for row in b.grid]
+        g[0][0] = 0
+        copy.deepcopy(b.grid)[0][1] = 0
+        self.assertNotEqual(b.grid[0][0], 0)
+        self.assertNotEqual(b.grid[0][1], 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
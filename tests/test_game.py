@@ -0,0 +1,78 @@
+# 봇이 뒤집히거나 범위 밖인 rect를 내도 점수/보드가 망가지지 않는지 확인
+#   python -m unittest discover -s tests
+import os
+import sys
+import types
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# game.py는 bots.greedybot을 기본 봇으로 import함 → 저장소에 없으면 빈 봇으로 대체
+try:
+    import bots.greedybot  # noqa: F401
+except ImportError:
+    class _NoMoveBot:
+        def nextmove(self, board):
+            return None
+
+        def gameover(self, board):
+            return False
+
+    _greedy = types.ModuleType("bots.greedybot")
+    _greedy.MyBot = _NoMoveBot
+    sys.modules.setdefault("bots", types.ModuleType("bots"))
+    sys.modules["bots.greedybot"] = _greedy
+
+import game
+from board import Board
+
+
+# 시드 25 보드에서 뒤집힌 rect (8,17,5,14)를 prefix 공식에 그대로 넣으면 합이 10이 됨
+SEED = 25
+INVERTED = (8, 17, 5, 14)
+
+
+class InvalidRectTest(unittest.TestCase):
+    def setUp(self):
+        self.board = Board(seed=SEED)
+
+    def test_sum_rejects_inverted_and_out_of_range(self):
+        b = self.board
+        for rect in [INVERTED, (1, 3, 1, 2), (0, 1, 1, 1), (1, 1, 11, 1), (1, 1, 1, 18)]:
+            self.assertEqual(game._sum_rect_grid(b, rect), -1, rect)
+        self.assertEqual(game._sum_rect_grid(b, (1, 1, 1, 1)), b.grid[0][0])
+
+    def test_apply_inverted_rect_is_a_failed_move(self):
+        b = self.board
+        before = b.grid_np.copy()
+        self.assertFalse(game._apply_move_direct(b, INVERTED))
+        self.assertEqual((b.score, b.failed_moves, b.successful_moves), (0, 1, 0))
+        self.assertTrue((b.grid_np == before).all())
+
+    def test_pending_inverted_rect_is_dropped(self):
+        g = game.Game(seed=SEED)
+        try:
+            g.start_new()
+            g._pending_rect, g._pending_ver = INVERTED, g._version
+            g._next_apply_time = 0.0
+            g._apply_pending_if_ready()
+            self.assertIsNone(g._pending_rect)
+            self.assertEqual(g.board.score, 0)
+            self.assertEqual(g.pop_state, "idle")
+        finally:
+            g.shutdown()
+
+
+class SnapshotTest(unittest.TestCase):
+    def test_restore_keeps_seed_score_and_counters(self):
+        b = Board(seed=SEED)
+        b.apply_move(b.find_all_valid_moves()[0][0])
+        b.apply_move(INVERTED[:2] + INVERTED[:2])  # 합이 10이 아닌 한 칸 → 실패 수
+        nb = game._restore(game._snapshot(b))
+        self.assertEqual(nb.packed(), b.packed())
+        self.assertEqual((nb.seed, nb.score, nb.total_moves, nb.failed_moves, nb.successful_moves),
+                         (b.seed, b.score, b.total_moves, b.failed_moves, b.successful_moves))
+
+
+if __name__ == "__main__":
+    unittest.main()